@@ -234,6 +234,96 @@ def apply_high_shelf(
     return _apply_iir_filter(audio_arr, b=b, a=a)
 
 
+def build_sos(
+    sr: int,
+    lowcut_hz: float = 0.0,
+    high_shelf_hz: float = 0.0,
+    high_shelf_db: float = 0.0,
+    order: int = 2,
+    slope: float = 1.0,
+) -> np.ndarray | None:
+    """
+    Build a combined second-order-section cascade for the enabled IIR stages
+    (low cut and/or high shelf), so both can run in a single filtering pass.
+
+    Returns None when neither stage is enabled so callers can skip filtering
+    entirely.
+    """
+    from scipy.signal import butter
+
+    if sr <= 0:
+        raise ValueError("sr must be a positive integer")
+
+    nyq = float(sr) / 2.0
+    sections = []
+
+    cutoff = float(lowcut_hz)
+    if np.isfinite(cutoff) and 0.0 < cutoff < nyq:
+        sections.append(butter(int(order), cutoff / nyq, btype="highpass", output="sos"))
+
+    f0 = float(high_shelf_hz)
+    g = float(high_shelf_db)
+    if np.isfinite(f0) and np.isfinite(g) and abs(g) >= 1e-9 and 0.0 < f0 < nyq:
+        S = float(slope)
+        if (not np.isfinite(S)) or S <= 0.0:
+            S = 1.0
+
+        # Same RBJ shelf coefficients as apply_high_shelf.
+        A = float(10.0 ** (g / 40.0))
+        w0 = float(2.0 * np.pi * f0 / float(sr))
+        cosw0 = float(np.cos(w0))
+        sinw0 = float(np.sin(w0))
+
+        alpha = float(sinw0 / 2.0 * np.sqrt((A + 1.0 / A) * (1.0 / S - 1.0) + 2.0))
+        sqrtA = float(np.sqrt(A))
+
+        b0 = A * ((A + 1.0) + (A - 1.0) * cosw0 + 2.0 * sqrtA * alpha)
+        b1 = -2.0 * A * ((A - 1.0) + (A + 1.0) * cosw0)
+        b2 = A * ((A + 1.0) + (A - 1.0) * cosw0 - 2.0 * sqrtA * alpha)
+        a0 = (A + 1.0) - (A - 1.0) * cosw0 + 2.0 * sqrtA * alpha
+        a1 = 2.0 * ((A - 1.0) - (A + 1.0) * cosw0)
+        a2 = (A + 1.0) - (A - 1.0) * cosw0 - 2.0 * sqrtA * alpha
+
+        if a0 != 0.0:
+            sections.append(
+                np.asarray(
+                    [[b0 / a0, b1 / a0, b2 / a0, 1.0, a1 / a0, a2 / a0]],
+                    dtype=np.float64,
+                )
+            )
+
+    if not sections:
+        return None
+    return np.vstack(sections)
+
+
+def apply_sos(audio: np.ndarray, sos: np.ndarray) -> np.ndarray:
+    from scipy.signal import sosfilt, sosfiltfilt
+
+    audio_arr = np.asarray(audio)
+    if audio_arr.ndim != 1:
+        raise ValueError("audio must be a mono (1D) array")
+    if sos is None or audio_arr.size == 0:
+        return audio_arr
+
+    x = np.asarray(audio_arr, dtype=np.float64)
+
+    try:
+        padlen = int(3 * (2 * int(sos.shape[0]) + 1))
+    except Exception:
+        padlen = 0
+
+    try:
+        if padlen > 0 and int(x.size) > int(padlen):
+            y = sosfiltfilt(sos, x)
+        else:
+            y = sosfilt(sos, x)
+    except Exception:
+        y = sosfilt(sos, x)
+
+    return np.asarray(y, dtype=audio_arr.dtype)
+
+
 def preview_cleanliness_mask(
     audio: np.ndarray,
     sr: int,
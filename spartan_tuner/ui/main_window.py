@@ -1,7 +1,11 @@
 import os
 import sys
 import json
+import math
+import time
+from functools import lru_cache, partial
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 import numpy as np
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
@@ -22,6 +26,13 @@ from PyQt6.QtCore import (
     QPropertyAnimation,
     QEasingCurve,
     QAbstractAnimation,
+    QThreadPool,
+    QSignalBlocker,
+    QMetaObject,
+    Q_ARG,
+    pyqtSlot,
+    pyqtProperty,
+    QObject,
 )
 from PyQt6.QtGui import QKeySequence, QShortcut, QPixmap, QAction, QActionGroup, QColor, QIcon
 from PyQt6.QtMultimedia import QAudio, QAudioFormat, QAudioSink, QMediaDevices
@@ -33,6 +44,464 @@ from ui.theme_editor import ThemeEditorWindow
 from utils.note_utils import note_name_to_midi
 from utils.i18n import i18n, tr
 
+# Bare extensions (no dot) checked against str.rpartition output.
+_SUPPORTED_AUDIO_EXTS = frozenset(("wav", "mp3", "flac", "ogg"))
+
+# MIDI lookup tables: (note name, octave) and equal-temperament frequency for
+# the full 0..127 range, precomputed so blob drags index instead of computing.
+_MIDI_NOTE_TABLE = tuple(
+    (("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")[m % 12], (m // 12) - 1)
+    for m in range(128)
+)
+_MIDI_FREQ = tuple(440.0 * 2.0 ** ((m - 69) / 12.0) for m in range(128))
+
+# Read-only so call sites can share it; mutable consumers copy via dict().
+_DEFAULT_THEME = MappingProxyType({
+    "bg": "#2E2E2E",
+    "panel": "#404040",
+    "primary": "#1D5AAA",
+    "accent": "#33CED6",
+    "highlight": "#6B999F",
+    "success": "#4EDE83",
+    "text": "#ffffff",
+})
+
+
+# The application stylesheet, specialized once per (theme, scale) via
+# str.format_map: the C-level template walk replaces the ~150 Python
+# string concatenations the old inline literal needed on every apply.
+_QSS_TEMPLATE = """\
+QMainWindow, QWidget {{
+background-color: {bg};
+color: {text};
+selection-background-color: {primary};
+selection-color: {text};
+font-size: {font_px}px;
+}}
+QWidget:disabled {{
+color: {text_disabled};
+}}
+QLabel {{
+background: transparent;
+}}
+QToolTip {{
+background-color: {panel};
+color: {text};
+border: 1px solid {border_subtle};
+padding: {menu_pad}px {pad_x_sm}px;
+border-radius: {radius_sm}px;
+}}
+QMenuBar {{
+background-color: {bg};
+color: {text};
+padding: {menubar_pad}px;
+}}
+QMenuBar::item {{
+background: transparent;
+padding: {pad_y_sm}px {pad_x_sm}px;
+margin: {pad_xs}px {tab_margin_x}px;
+border-radius: {radius_sm}px;
+}}
+QMenuBar::item:selected {{
+background: {panel};
+}}
+QMenu {{
+background-color: {panel};
+border: 1px solid {border_subtle};
+color: {text};
+padding: {menu_pad}px;
+}}
+QMenu::item {{
+padding: {menu_item_y}px {menu_item_right}px {menu_item_y}px {menu_item_left}px;
+border-radius: {radius_sm}px;
+background: transparent;
+}}
+QMenu::item:selected {{
+background: {highlight};
+color: {text};
+}}
+QMenu::separator {{
+height: 1px;
+background: {border_subtle};
+margin: {menu_pad}px {pad_x_sm}px;
+}}
+QTabWidget::pane {{
+border: 1px solid {border_subtle};
+border-radius: {radius_md}px;
+top: -1px;
+}}
+QTabBar::tab {{
+background: transparent;
+padding: {tab_pad_y}px {tab_pad_x}px;
+margin: {tab_margin_y}px {tab_margin_x}px;
+border-radius: {tab_radius}px;
+color: {text_muted};
+}}
+QTabBar::tab:hover {{
+background: {panel_2};
+color: {text};
+}}
+QTabBar::tab:selected {{
+background: {panel};
+color: {text};
+}}
+QGroupBox {{
+background-color: {panel_2};
+border: 1px solid {border_subtle};
+border-radius: {radius_lg}px;
+margin-top: {group_margin_top}px;
+padding: {group_padding}px;
+}}
+QGroupBox::title {{
+subcontrol-origin: margin;
+subcontrol-position: top left;
+left: {radius_lg}px;
+padding: 0 {menu_pad}px;
+background: transparent;
+border: none;
+}}
+QLineEdit, QTextEdit, QPlainTextEdit {{
+background-color: {panel};
+border: 1px solid {border_subtle};
+border-radius: {radius_md}px;
+padding: {pad_y_sm}px {pad_x_sm}px;
+color: {text};
+}}
+QLineEdit:hover, QTextEdit:hover, QPlainTextEdit:hover {{
+border-color: {border_hover};
+}}
+QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {{
+border-color: {accent};
+}}
+QPushButton {{
+background-color: {panel};
+border: 1px solid {border_subtle};
+border-radius: {radius_md}px;
+padding: {pad_y_btn}px {pad_x_btn}px;
+color: {text};
+}}
+QPushButton:hover {{
+background-color: {panel_hover};
+border-color: {border_hover};
+}}
+QPushButton:pressed {{
+background-color: {panel_2};
+border-color: {primary};
+}}
+QPushButton:disabled {{
+background-color: {panel_2};
+border-color: {border_subtle};
+color: {text_disabled};
+}}
+QComboBox {{
+background-color: {panel};
+border: 1px solid {border_subtle};
+border-radius: {radius_md}px;
+padding: {pad_y_sm}px {pad_x_sm}px;
+color: {text};
+}}
+QComboBox:hover {{
+border-color: {border_hover};
+}}
+QComboBox:focus {{
+border-color: {accent};
+}}
+QComboBox::drop-down {{
+border: none;
+width: {dropdown_w}px;
+}}
+QComboBox QAbstractItemView {{
+background-color: {panel};
+color: {text};
+border: 1px solid {border_subtle};
+outline: 0;
+selection-background-color: {highlight};
+}}
+QAbstractItemView::item {{
+padding: {menu_item_y}px {pad_x_sm}px;
+border-radius: {radius_sm}px;
+}}
+QProgressBar {{
+border: 1px solid {border_subtle};
+border-radius: {radius_md}px;
+background: {panel_2};
+text-align: center;
+padding: {pad_xs}px;
+}}
+QProgressBar::chunk {{
+background: {primary};
+border-radius: {radius_sm}px;
+}}
+QStatusBar {{
+background: {bg};
+color: {text_muted};
+}}
+QStatusBar::item {{
+border: none;
+}}
+"""
+
+# Scoped to the settings panel: sliders, spin boxes, and checkboxes all
+# live there, and a child-level sheet keeps Qt's re-polish confined to
+# that subtree instead of walking every descendant of the main window.
+_QSS_CONTROLS_TEMPLATE = """\
+QSpinBox, QDoubleSpinBox {{
+background-color: {panel};
+border: 1px solid {border_subtle};
+border-radius: {radius_md}px;
+padding: {pad_y_sm}px {pad_x_sm}px;
+color: {text};
+}}
+QSpinBox:hover, QDoubleSpinBox:hover {{
+border-color: {border_hover};
+}}
+QSpinBox:focus, QDoubleSpinBox:focus {{
+border-color: {accent};
+}}
+QSpinBox::up-button, QDoubleSpinBox::up-button, QSpinBox::down-button, QDoubleSpinBox::down-button {{
+width: {spin_btn_w}px;
+border: none;
+background: transparent;
+}}
+QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover, QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {{
+background: {panel_2};
+border-radius: 8px;
+}}
+QSlider {{
+background: transparent;
+border: none;
+outline: none;
+}}
+QSlider:focus {{
+border: none;
+outline: none;
+}}
+QSlider::groove:horizontal {{
+background: {panel_2};
+border: none;
+height: {slider_groove_h}px;
+border-radius: {groove_rad}px;
+}}
+QSlider::sub-page:horizontal {{
+background: {accent};
+border: none;
+border-radius: 4px;
+}}
+QSlider::add-page:horizontal {{
+background: {panel_2};
+border: none;
+border-radius: 4px;
+}}
+QSlider::handle:horizontal {{
+background: {text};
+width: {slider_handle_w}px;
+margin: {handle_margin}px 0;
+border-radius: {radius_sm}px;
+border: 2px solid {accent};
+outline: none;
+}}
+QSlider::handle:horizontal:hover {{
+border-color: {primary};
+}}
+QSlider::handle:horizontal:pressed {{
+border-color: {success};
+}}
+QCheckBox {{
+spacing: {menu_item_y}px;
+background: transparent;
+}}
+QCheckBox:hover {{
+color: {text};
+}}
+QCheckBox::indicator {{
+width: {checkbox_ind}px;
+height: {checkbox_ind}px;
+border-radius: {checkbox_rad}px;
+border: 1px solid {border_subtle};
+background-color: {panel};
+}}
+QCheckBox::indicator:hover {{
+border-color: {border_hover};
+}}
+QCheckBox::indicator:checked {{
+background-color: {accent};
+border-color: {accent};
+}}
+QCheckBox::indicator:checked:hover {{
+background-color: {primary};
+border-color: {primary};
+}}
+"""
+
+# Scoped to the scrolling containers that actually show scrollbars.
+_QSS_SCROLLBAR_TEMPLATE = """\
+QScrollBar:vertical {{
+background: transparent;
+width: {scrollbar_thick}px;
+margin: 0px;
+}}
+QScrollBar::handle:vertical {{
+background: {panel_hover};
+border-radius: {scrollbar_rad}px;
+min-height: {scroll_min}px;
+}}
+QScrollBar::handle:vertical:hover {{
+background: {highlight};
+}}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+height: 0px;
+}}
+QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
+background: transparent;
+}}
+QScrollBar:horizontal {{
+background: transparent;
+height: {scrollbar_thick}px;
+margin: 0px;
+}}
+QScrollBar::handle:horizontal {{
+background: {panel_hover};
+border-radius: {scrollbar_rad}px;
+min-width: {scroll_min}px;
+}}
+QScrollBar::handle:horizontal:hover {{
+background: {highlight};
+}}
+QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
+width: 0px;
+}}
+QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
+background: transparent;
+}}
+"""
+
+
+def _clamp01(v: float) -> float:
+    return 0.0 if v < 0.0 else 1.0 if v > 1.0 else v
+
+
+@lru_cache(maxsize=8)
+def _fade_ramp(n: int) -> np.ndarray:
+    """Linear fade-in ramp, memoized per length.
+
+    The preview fade length only depends on the (fixed) sample rate, so in
+    practice this is computed once and shared across every playback instead
+    of rebuilding the linspace on each Play press. Read-only so the cached
+    array can never be clobbered by an in-place consumer.
+    """
+    ramp = np.linspace(0.0, 1.0, int(n), dtype=np.float32)
+    ramp.setflags(write=False)
+    return ramp
+
+
+@lru_cache(maxsize=None)
+def _dsp_mods() -> SimpleNamespace:
+    """Resolve the processing-pipeline DSP callables once per process.
+
+    run() used to do the from-imports on every invocation; the modules are
+    cached by CPython but the attribute resolution and binding still repeat.
+    WarmupThread primes this so the first real processing job pays nothing.
+    """
+    from audio.autotuner import (
+        autotune_to_note,
+        autotune_with_formant_shift,
+        autotune_soft_to_note,
+        autotune_praat_soft_to_note,
+    )
+    from audio.normalizer import normalize_audio
+    from audio.cleanliness import (
+        apply_cleanliness,
+        apply_high_shelf,
+        apply_low_cut,
+        apply_sos,
+        build_sos,
+    )
+    from audio.time_stretch import STRETCHERS
+
+    return SimpleNamespace(
+        autotune_to_note=autotune_to_note,
+        autotune_with_formant_shift=autotune_with_formant_shift,
+        autotune_soft_to_note=autotune_soft_to_note,
+        autotune_praat_soft_to_note=autotune_praat_soft_to_note,
+        normalize_audio=normalize_audio,
+        apply_cleanliness=apply_cleanliness,
+        apply_high_shelf=apply_high_shelf,
+        apply_low_cut=apply_low_cut,
+        apply_sos=apply_sos,
+        build_sos=build_sos,
+        STRETCHERS=STRETCHERS,
+    )
+
+
+def _normalize_settings(d: dict) -> SimpleNamespace:
+    """Coerce a raw settings dict into typed, validated attributes once.
+
+    ProcessingThread.run used to re-cast every value at each use site; this
+    snapshot does all the casting (and finiteness checks, via math.isfinite
+    rather than the heavier numpy.isfinite-on-scalar) in one place.
+    """
+    low_cut_hz = float(d.get("clean_lowcut_hz", 0.0))
+    if not (math.isfinite(low_cut_hz) and low_cut_hz > 0.0):
+        low_cut_hz = 0.0
+
+    hs_db = float(d.get("clean_high_shelf_db", 0.0))
+    hs_hz = float(d.get("clean_high_shelf_hz", 10000.0))
+    if not (math.isfinite(hs_db) and math.isfinite(hs_hz) and abs(hs_db) > 1e-9):
+        hs_db = 0.0
+
+    cleanliness = float(d.get("cleanliness_percent", 0.0))
+    if not math.isfinite(cleanliness):
+        cleanliness = 0.0
+
+    stretch_factor = float(d.get("stretch_factor", 1.0))
+
+    return SimpleNamespace(
+        pitch_mode=str(d.get("pitch_mode", "world_hard")),
+        target_note=str(d["target_note"]),
+        preserve_formants=bool(d.get("preserve_formants", True)),
+        formant_shift_cents=int(d.get("formant_shift_cents", 0)),
+        pitch_amount=float(d.get("pitch_amount", 1.0)),
+        retune_speed_ms=float(d.get("retune_speed_ms", 40.0)),
+        preserve_vibrato=float(d.get("preserve_vibrato", 1.0)),
+        stretch_factor=stretch_factor,
+        stretch_method=str(d.get("stretch_method", "audiotsm_wsola")),
+        do_stretch=abs(stretch_factor - 1.0) > 1e-6,
+        low_cut_hz=low_cut_hz,
+        cleanliness=cleanliness,
+        hs_db=hs_db,
+        hs_hz=hs_hz,
+        normalize=bool(d["normalize"]),
+    )
+
+
+def _ensure_numba_cache_dir():
+    """Point numba (used by librosa's jitted kernels) at a persistent cache dir.
+
+    Must run before anything imports librosa/numba — numba reads the env var
+    at import time — or the artifacts persisted by a previous launch's warmup
+    are never found and JIT compilation is paid again.
+    """
+    try:
+        cache_base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppCacheLocation)
+        if cache_base:
+            os.environ.setdefault("NUMBA_CACHE_DIR", str(Path(cache_base) / "numba"))
+    except Exception:
+        pass
+
+
+def _warmup_marker_path() -> Path | None:
+    """Sentinel recording that warmup has completed once on this install.
+
+    Versioned so a future warmup change can invalidate old markers.
+    """
+    try:
+        base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppCacheLocation)
+        if not base:
+            return None
+        return Path(base) / "warmup.v1"
+    except Exception:
+        return None
+
 
 class ProcessingThread(QThread):
     """Background thread for audio processing to keep UI responsive."""
@@ -40,6 +509,7 @@ class ProcessingThread(QThread):
     finished = pyqtSignal(np.ndarray)
     error = pyqtSignal(str)
     progress = pyqtSignal(str)
+    interrupted = pyqtSignal()
 
     def __init__(self, audio, sr, settings):
         super().__init__()
@@ -49,93 +519,108 @@ class ProcessingThread(QThread):
 
     def run(self):
         try:
-            from audio.autotuner import (
-                autotune_to_note,
-                autotune_with_formant_shift,
-                autotune_soft_to_note,
-                autotune_praat_soft_to_note,
-            )
-            from audio.normalizer import normalize_audio
-            from audio.cleanliness import apply_cleanliness, apply_high_shelf, apply_low_cut
-            from audio.time_stretch import STRETCHERS
+            m = _dsp_mods()
 
-            result = self.audio.copy()
+            # No upfront copy: every stage below is non-mutating and returns a
+            # freshly allocated array (normalize_audio included), so the input
+            # buffer is never written to.
+            result = self.audio
+            cfg = _normalize_settings(self.settings)
+            sr = int(self.sr)
 
-            pitch_mode = str(self.settings.get("pitch_mode", "world_hard"))
             self.progress.emit(tr("progress.autotuning", "Autotuning..."))
-            if pitch_mode == "world_soft":
-                result = autotune_soft_to_note(
+            if cfg.pitch_mode == "world_soft":
+                result = m.autotune_soft_to_note(
                     result,
-                    int(self.sr),
-                    str(self.settings["target_note"]),
-                    preserve_formants=bool(self.settings.get("preserve_formants", True)),
-                    formant_shift_cents=int(self.settings.get("formant_shift_cents", 0)),
-                    amount=float(self.settings.get("pitch_amount", 1.0)),
-                    retune_speed_ms=float(self.settings.get("retune_speed_ms", 40.0)),
-                    preserve_vibrato=float(self.settings.get("preserve_vibrato", 1.0)),
+                    sr,
+                    cfg.target_note,
+                    preserve_formants=cfg.preserve_formants,
+                    formant_shift_cents=cfg.formant_shift_cents,
+                    amount=cfg.pitch_amount,
+                    retune_speed_ms=cfg.retune_speed_ms,
+                    preserve_vibrato=cfg.preserve_vibrato,
                     voicing_mode="strict",
                 )
-            elif pitch_mode == "praat_soft":
-                result = autotune_praat_soft_to_note(
+            elif cfg.pitch_mode == "praat_soft":
+                result = m.autotune_praat_soft_to_note(
                     result,
-                    int(self.sr),
-                    str(self.settings["target_note"]),
-                    amount=float(self.settings.get("pitch_amount", 1.0)),
-                    retune_speed_ms=float(self.settings.get("retune_speed_ms", 40.0)),
-                    preserve_vibrato=float(self.settings.get("preserve_vibrato", 1.0)),
+                    sr,
+                    cfg.target_note,
+                    amount=cfg.pitch_amount,
+                    retune_speed_ms=cfg.retune_speed_ms,
+                    preserve_vibrato=cfg.preserve_vibrato,
                 )
             else:
-                if self.settings["preserve_formants"]:
-                    result = autotune_to_note(result, self.sr, self.settings["target_note"], preserve_formants=True)
+                if cfg.preserve_formants:
+                    result = m.autotune_to_note(result, sr, cfg.target_note, preserve_formants=True)
                 else:
-                    result = autotune_with_formant_shift(
-                        result, self.sr,
-                        self.settings["target_note"],
-                        self.settings["formant_shift_cents"]
+                    result = m.autotune_with_formant_shift(
+                        result, sr,
+                        cfg.target_note,
+                        cfg.formant_shift_cents,
                     )
+            if self.isInterruptionRequested():
+                self.interrupted.emit()
+                return
 
-            stretch_factor = float(self.settings.get("stretch_factor", 1.0))
-            stretch_method = str(self.settings.get("stretch_method", "audiotsm_wsola"))
-            if abs(stretch_factor - 1.0) > 1e-6:
+            if cfg.do_stretch:
                 self.progress.emit(
                     tr("progress.stretching_fmt", "Stretching... ({method}, x{factor:.2f})").format(
-                        method=stretch_method,
-                        factor=stretch_factor,
+                        method=cfg.stretch_method,
+                        factor=cfg.stretch_factor,
                     )
                 )
-                fn = STRETCHERS.get(stretch_method)
+                fn = m.STRETCHERS.get(cfg.stretch_method)
                 if fn is None:
-                    raise ValueError(f"Unknown stretching method: {stretch_method}")
-                result = fn(result, int(self.sr), float(stretch_factor))
+                    raise ValueError(f"Unknown stretching method: {cfg.stretch_method}")
+                result = fn(result, sr, cfg.stretch_factor)
+            if self.isInterruptionRequested():
+                self.interrupted.emit()
+                return
 
-            low_cut_hz = float(self.settings.get("clean_lowcut_hz", 0.0))
-            if np.isfinite(low_cut_hz) and low_cut_hz > 0.0:
-                self.progress.emit(
-                    tr("progress.lowcut_fmt", "Removing sub (low cut {hz:.0f} Hz)...").format(hz=low_cut_hz)
-                )
-                result = apply_low_cut(result, int(self.sr), float(low_cut_hz))
+            if cfg.cleanliness > 0.0:
+                # The STFT-based cleanliness stage sits between the two IIR
+                # stages, so the pipeline must stay sequential to keep the
+                # low cut ahead of the pyin analysis and the shelf behind it.
+                if cfg.low_cut_hz > 0.0:
+                    self.progress.emit(
+                        tr("progress.lowcut_fmt", "Removing sub (low cut {hz:.0f} Hz)...").format(hz=cfg.low_cut_hz)
+                    )
+                    result = m.apply_low_cut(result, sr, cfg.low_cut_hz)
 
-            cleanliness = float(self.settings.get("cleanliness_percent", 0.0))
-            if np.isfinite(cleanliness) and cleanliness > 0.0:
                 self.progress.emit(
-                    tr("progress.cleanliness_fmt", "Applying {pct:.0f}% cleanliness...").format(pct=cleanliness)
+                    tr("progress.cleanliness_fmt", "Applying {pct:.0f}% cleanliness...").format(pct=cfg.cleanliness)
                 )
-                result = apply_cleanliness(result, int(self.sr), float(cleanliness))
-
-            hs_db = float(self.settings.get("clean_high_shelf_db", 0.0))
-            hs_hz = float(self.settings.get("clean_high_shelf_hz", 10000.0))
-            if np.isfinite(hs_db) and np.isfinite(hs_hz) and abs(hs_db) > 1e-9:
-                self.progress.emit(
-                    tr("progress.highshelf_fmt", "Cleaning highs (shelf {db:.1f} dB @ {hz:.0f} Hz)...").format(
-                        db=hs_db,
-                        hz=hs_hz,
+                result = m.apply_cleanliness(result, sr, cfg.cleanliness)
+
+                if cfg.hs_db != 0.0:
+                    self.progress.emit(
+                        tr("progress.highshelf_fmt", "Cleaning highs (shelf {db:.1f} dB @ {hz:.0f} Hz)...").format(
+                            db=cfg.hs_db,
+                            hz=cfg.hs_hz,
+                        )
                     )
+                    result = m.apply_high_shelf(result, sr, cfg.hs_hz, cfg.hs_db)
+            else:
+                # Without cleanliness in between, low cut and high shelf fuse
+                # into one SOS cascade: a single streaming pass over the audio
+                # instead of two.
+                sos = m.build_sos(
+                    sr,
+                    lowcut_hz=cfg.low_cut_hz,
+                    high_shelf_hz=cfg.hs_hz,
+                    high_shelf_db=cfg.hs_db,
                 )
-                result = apply_high_shelf(result, int(self.sr), float(hs_hz), float(hs_db))
+                if sos is not None:
+                    self.progress.emit(tr("progress.filtering", "Filtering..."))
+                    result = m.apply_sos(result, sos)
+            if self.isInterruptionRequested():
+                self.interrupted.emit()
+                return
 
-            if self.settings["normalize"]:
+            if cfg.normalize:
                 self.progress.emit(tr("progress.normalizing", "Normalizing..."))
-                result = normalize_audio(result, target_db=-0.1)
+                result = m.normalize_audio(result, target_db=-0.1)
 
             self.finished.emit(result)
 
@@ -150,13 +635,26 @@ class WarmupThread(QThread):
 
     def run(self):
         try:
+            # The cache dir is normally set at window construction, but make
+            # sure of it before this thread's own librosa/numba import.
+            _ensure_numba_cache_dir()
+
             from audio.pitch_detector import get_predominant_pitch
 
             self.progress.emit(tr("progress.preparing_audio_engine", "Preparing audio engine..."))
 
+            # Prime the processing-pipeline imports so the first real job
+            # skips them too.
+            _dsp_mods()
+
             sr = 44100
-            t = np.linspace(0.0, 0.25, int(sr * 0.25), endpoint=False, dtype=np.float32)
-            x = (0.15 * np.sin(2.0 * np.pi * 220.0 * t)).astype(np.float32)
+            # 0.25 s of a 220 Hz sine, built in one buffer with in-place ops
+            # instead of materializing linspace/product/sin temporaries.
+            n = int(sr * 0.25)
+            x = np.arange(n, dtype=np.float32)
+            np.multiply(x, (2.0 * np.pi * 220.0) / float(sr), out=x)
+            np.sin(x, out=x)
+            np.multiply(x, 0.15, out=x)
 
             if self.isInterruptionRequested():
                 return
@@ -173,41 +671,98 @@ class WarmupThread(QThread):
 class LoadAudioThread(QThread):
     finished = pyqtSignal(object, int, int, object, object, object)
     error = pyqtSignal(str)
-    progress = pyqtSignal(str)
+    progress = pyqtSignal(int, str)
 
-    def __init__(self, file_path: str, fast_pitch: bool):
+    def __init__(self, file_path: str, fast_pitch: bool, cached_pitch=None):
         super().__init__()
         self.file_path = str(file_path)
         self.fast_pitch = bool(fast_pitch)
+        self.cached_pitch = cached_pitch
 
     def run(self):
         try:
             from audio.loader import load_audio
             from audio.pitch_detector import get_predominant_pitch
 
-            self.progress.emit(tr("progress.reading_file", "Reading file..."))
+            self.progress.emit(1, tr("progress.reading_file", "Reading file..."))
             audio, sr, original_sr = load_audio(self.file_path)
+            # The whole downstream pipeline assumes float32; make sure nothing
+            # widens it to float64 (which would double bandwidth in every stage).
+            if audio.dtype != np.float32 or not audio.flags["C_CONTIGUOUS"]:
+                audio = np.ascontiguousarray(audio, dtype=np.float32)
             if self.isInterruptionRequested():
                 return
 
-            self.progress.emit(tr("progress.detecting_pitch", "Detecting pitch..."))
-            freq, note, cents = get_predominant_pitch(audio, int(sr), fast=bool(self.fast_pitch))
+            if self.cached_pitch is not None:
+                freq, note, cents = self.cached_pitch
+            else:
+                self.progress.emit(2, tr("progress.detecting_pitch", "Detecting pitch..."))
+                freq, note, cents = get_predominant_pitch(audio, int(sr), fast=bool(self.fast_pitch))
             if self.isInterruptionRequested():
                 return
 
-            self.progress.emit(tr("progress.finalizing", "Finalizing..."))
+            self.progress.emit(3, tr("progress.finalizing", "Finalizing..."))
             self.finished.emit(audio, int(sr), int(original_sr), freq, note, cents)
 
         except Exception as e:
             self.error.emit(str(e))
 
 
+class _VolumeProxy(QObject):
+    """Animatable ``volume`` property forwarding to the live audio sink.
+
+    Gives QPropertyAnimation something to drive so the preview fades run on
+    Qt's native animation clock instead of a Python-ticked timer.
+    """
+
+    def __init__(self, window):
+        super().__init__(window)
+        self._window = window
+
+    def _get_volume(self) -> float:
+        last = self._window._last_written_volume
+        if last is not None:
+            return float(last)
+        return float(self._window._preview_volume)
+
+    def _set_volume(self, v: float):
+        win = self._window
+        sink = win._audio_sink
+        if sink is None:
+            return
+        clamped = _clamp01(float(v))
+        last = win._last_written_volume
+        # 1/512 is below 16-bit volume quantization; smaller deltas are noise.
+        if last is not None and abs(clamped - last) < (1.0 / 512.0):
+            return
+        try:
+            sink.setVolume(clamped)
+        except (RuntimeError, AttributeError):
+            # Sink's C++ object was torn down under us; cleanup will follow.
+            return
+        win._last_written_volume = clamped
+
+    volume = pyqtProperty(float, fget=_get_volume, fset=_set_volume)
+
+
 class MainWindow(QMainWindow):
     """Main application window for FreqEnforcer."""
 
+    # Pre-bound once at class creation as plain ints; the state callback
+    # fires on every backend transition and should not chase QAudio.State.*
+    # lookups or enum __eq__ dispatch.
+    _STATE_ACTIVE = int(QAudio.State.ActiveState)
+    _STATE_IDLE = int(QAudio.State.IdleState)
+    _STATE_STOPPED = int(QAudio.State.StoppedState)
+
     def __init__(self, debug: bool = False, debug_notes_path: str | None = None):
         super().__init__()
 
+        # Before any code path (warmup, load, processing) can import
+        # librosa/numba, regardless of whether the warmup marker skips the
+        # warmup thread on this launch.
+        _ensure_numba_cache_dir()
+
         self.setWindowTitle(tr("app.title", "FreqEnforcer"))
         self.setMinimumSize(1200, 600)
         self.resize(1920, 1080)
@@ -216,7 +771,11 @@ class MainWindow(QMainWindow):
             base_dir = Path(getattr(sys, "_MEIPASS", str(Path(__file__).resolve().parent.parent)))
             icon_path = base_dir / "ICON.ico"
             if icon_path.exists():
-                self.setWindowIcon(QIcon(str(icon_path)))
+                pm = self._load_cached_pixmap(icon_path, "window_icon")
+                if not pm.isNull():
+                    self.setWindowIcon(QIcon(pm))
+                else:
+                    self.setWindowIcon(QIcon(str(icon_path)))
         except Exception:
             pass
 
@@ -227,24 +786,47 @@ class MainWindow(QMainWindow):
         self.current_file_path = None
         self._waveform_view = "original"  # original | processed
 
+        self._pitch_cache = {}
+        self._pitch_cache_max = 8
+
         self._audio_sink = None
         self._audio_buffer = None
         self._audio_bytes = None
+        self._sink_state = None  # bound QAudioSink.state, cached per sink
+        self._audio_sink_sr = None  # sample rate the cached sink was built for
+        # 100 ms of 16-bit mono between us and the callback keeps press-to-
+        # sound latency low; underruns grow it (below) up to half a second.
+        self._preview_buffer_ms = 100
         self._preview_cleanup_scheduled = False
+        self._pcm_cache = {}  # (id(array), sr, len) -> QByteArray, capped at 2
+        self._pcm_encoding = False
+        self._pcm_async_key = None
+        self._pcm_async_result = None
+        self._last_waveform_key = None  # (view, id(array), sr) last sent to the widget
 
         self._preview_volume = 1.0
-        self._volume_ramp_timer = QTimer(self)
-        self._volume_ramp_timer.setInterval(8)
-        self._volume_ramp_timer.timeout.connect(self._on_volume_ramp_tick)
-        self._volume_ramp_steps_left = 0
-        self._volume_ramp_step = 0.0
-        self._volume_ramp_target = 1.0
+        self._vol_proxy = _VolumeProxy(self)
+        self._volume_ramp_anim = QPropertyAnimation(self._vol_proxy, b"volume", self)
+        self._volume_ramp_anim.setEasingCurve(QEasingCurve.Type.Linear)
+        self._volume_ramp_anim.finished.connect(self._on_volume_ramp_finished)
         self._volume_ramp_on_done = None
+        self._last_written_volume = None  # last value actually pushed to the backend
 
         self._processing_debounce_timer = QTimer(self)
         self._processing_debounce_timer.setSingleShot(True)
         self._processing_debounce_timer.setInterval(600)
         self._processing_debounce_timer.timeout.connect(self._on_process)
+        # A long slider drag restarts the debounce timer on every tick; cap
+        # how long a burst can keep pushing the run out.
+        self._debounce_max_latency_s = 2.0
+        self._debounce_first_scheduled_ts = None
+
+        # Collapses bursts of note-combo/octave-spin signals (arrow keys,
+        # wheel scrolling) into one piano-roll sync.
+        self._sync_debounce_timer = QTimer(self)
+        self._sync_debounce_timer.setSingleShot(True)
+        self._sync_debounce_timer.setInterval(30)
+        self._sync_debounce_timer.timeout.connect(self._sync_piano_roll_to_settings)
 
         self._apply_processed_timer = QTimer(self)
         self._apply_processed_timer.setSingleShot(True)
@@ -259,6 +841,10 @@ class MainWindow(QMainWindow):
         self._latest_completed_token = 0
 
         self._drop_highlight_active = False
+        self._drag_accept = False  # decision cached from dragEnterEvent
+        self._closed = False
+
+        self._last_sync = None
 
         self._qsettings = QSettings("FreqEnforcer", "FreqEnforcer")
 
@@ -273,8 +859,14 @@ class MainWindow(QMainWindow):
             pass
 
         self._theme = self._read_theme()
+        self._theme_json = json.dumps(self._theme, sort_keys=True, separators=(",", ":"))
         self._theme_editor = None
         self._theme_library = {}
+        self._theme_lib_sig = None
+        self._theme_editor_lib_sig = None
+        self._theme_lib_cache = None
+        self._last_qss_key = None
+        self._last_qss = None
 
         try:
             settings_version = int(self._qsettings.value("app/settings_version", 0))
@@ -283,9 +875,11 @@ class MainWindow(QMainWindow):
 
         if settings_version < 2:
             try:
-                self._qsettings.setValue("options/show_loading_dialog", True)
-                self._qsettings.setValue("options/performance_mode", False)
-                self._qsettings.setValue("options/warmup_enabled", True)
+                self._qsettings.beginGroup("options")
+                self._qsettings.setValue("show_loading_dialog", True)
+                self._qsettings.setValue("performance_mode", False)
+                self._qsettings.setValue("warmup_enabled", True)
+                self._qsettings.endGroup()
                 self._qsettings.setValue("app/settings_version", 2)
             except Exception:
                 pass
@@ -301,14 +895,24 @@ class MainWindow(QMainWindow):
         self._save_settings_timer.setSingleShot(True)
         self._save_settings_timer.setInterval(250)
         self._save_settings_timer.timeout.connect(self._save_persistent_settings)
+        # Hashes of the last values actually written, so unchanged payloads
+        # skip the QSettings backend (registry on Windows) entirely.
+        self._last_saved_hashes = {"theme": None, "panel": None, "geom": None}
+
+        # One beginGroup/endGroup scan instead of three fully-qualified reads:
+        # each value() call otherwise re-parses the key path and takes the
+        # backend lock separately.
+        self._qsettings.beginGroup("options")
+        self._performance_mode = bool(self._qsettings.value("performance_mode", False, type=bool))
+        self._show_loading_dialog = bool(self._qsettings.value("show_loading_dialog", True, type=bool))
+        self._warmup_enabled = bool(self._qsettings.value("warmup_enabled", True, type=bool))
+        self._qsettings.endGroup()
 
-        self._performance_mode = bool(self._qsettings.value("options/performance_mode", False, type=bool))
-        self._show_loading_dialog = bool(self._qsettings.value("options/show_loading_dialog", True, type=bool))
         self._load_thread = None
         self._load_dialog = None
         self._loading_file_path = None
+        self._last_load_stage = 0
 
-        self._warmup_enabled = bool(self._qsettings.value("options/warmup_enabled", True, type=bool))
         self._warmup_thread = None
         self._warmup_done = False
 
@@ -318,7 +922,16 @@ class MainWindow(QMainWindow):
         self._debug_notes_path = debug_notes_path
         self._debug_text = None
 
+        try:
+            app = QApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self._wait_for_background_saves)
+        except Exception:
+            pass
+
         self._ui_scale = 1.0
+        self._last_size_for_scale = (-1, -1)
+        self._last_scale = 1.0
         self._base_app_font = None
         try:
             self._base_app_font = QApplication.font()
@@ -331,6 +944,11 @@ class MainWindow(QMainWindow):
         self._scale_update_timer.setInterval(80)
         self._scale_update_timer.timeout.connect(self._apply_pending_ui_scale)
 
+        self._responsive_timer = QTimer(self)
+        self._responsive_timer.setSingleShot(True)
+        self._responsive_timer.setInterval(80)
+        self._responsive_timer.timeout.connect(self._update_responsive_layout)
+
         self._setup_ui()
 
         self._responsive_vertical = None
@@ -354,10 +972,12 @@ class MainWindow(QMainWindow):
 
         self._setup_menu()
 
-        self._set_performance_mode(self._performance_mode)
+        self._apply_performance_mode(self._performance_mode)
 
         if self._debug_enabled:
-            self._setup_debug_dock()
+            # Deferred past show()/first paint; the dock also kicks off a
+            # notes-file read that should stay off the startup critical path.
+            QTimer.singleShot(0, self._setup_debug_dock)
 
         self._apply_theme()
 
@@ -414,29 +1034,84 @@ class MainWindow(QMainWindow):
 
     def _save_persistent_settings(self):
         try:
-            self._qsettings.setValue("options/performance_mode", bool(self._performance_mode))
-            self._qsettings.setValue("options/show_loading_dialog", bool(self._show_loading_dialog))
-            self._qsettings.setValue("options/warmup_enabled", bool(self._warmup_enabled))
+            self._qsettings.beginGroup("options")
+            self._qsettings.setValue("performance_mode", bool(self._performance_mode))
+            self._qsettings.setValue("show_loading_dialog", bool(self._show_loading_dialog))
+            self._qsettings.setValue("warmup_enabled", bool(self._warmup_enabled))
+            self._qsettings.endGroup()
             self._qsettings.setValue("ui/language", str(self._language_code))
         except Exception:
             pass
 
         try:
-            self._qsettings.setValue("theme/json", json.dumps(self._theme))
+            theme_json = json.dumps(self._theme, sort_keys=True)
+            h = hash(theme_json)
+            if h != self._last_saved_hashes["theme"]:
+                self._qsettings.setValue("theme/json", theme_json)
+                self._last_saved_hashes["theme"] = h
+        except Exception:
+            pass
+
+        try:
+            state_json = json.dumps(self.settings_panel.get_ui_state(), sort_keys=True)
+            h = hash(state_json)
+            if h != self._last_saved_hashes["panel"]:
+                self._qsettings.setValue("settings_panel/state_json", state_json)
+                self._last_saved_hashes["panel"] = h
+        except Exception:
+            pass
+
+        try:
+            geom = self.saveGeometry()
+            h = hash(bytes(geom))
+            if h != self._last_saved_hashes["geom"]:
+                self._qsettings.setValue("ui/geometry", geom)
+                self._last_saved_hashes["geom"] = h
         except Exception:
             pass
 
+        # One explicit flush for the whole batch rather than relying on Qt's
+        # per-setValue write-behind.
         try:
-            state = self.settings_panel.get_ui_state()
-            self._qsettings.setValue("settings_panel/state_json", json.dumps(state))
+            self._qsettings.sync()
         except Exception:
             pass
 
+    def _load_cached_pixmap(self, src_path: Path, cache_name: str) -> QPixmap:
+        """Load a pixmap, preferring a pre-decoded PNG cached from a prior run.
+
+        The cache entry is invalidated whenever the source file is newer, and
+        any failure falls back to decoding the source directly.
+        """
+        cache_file = None
         try:
-            self._qsettings.setValue("ui/geometry", self.saveGeometry())
+            base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppCacheLocation)
+            if base:
+                cache_file = Path(base) / "pixmaps" / f"{cache_name}.png"
+        except Exception:
+            cache_file = None
+
+        try:
+            if (
+                cache_file is not None
+                and cache_file.exists()
+                and cache_file.stat().st_mtime >= src_path.stat().st_mtime
+            ):
+                pm = QPixmap()
+                if pm.loadFromData(cache_file.read_bytes(), "PNG") and not pm.isNull():
+                    return pm
         except Exception:
             pass
 
+        pm = QPixmap(str(src_path))
+        if cache_file is not None and not pm.isNull():
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                pm.save(str(cache_file), "PNG")
+            except Exception:
+                pass
+        return pm
+
     def _apply_default_window_geometry(self):
         desired_w = 1342
         desired_h = 967
@@ -472,10 +1147,11 @@ class MainWindow(QMainWindow):
         logo_label = QLabel()
         self._logo_label = logo_label
         self._logo_pixmap = None
+        self._logo_scaled_cache = {}  # inner px -> QPixmap, capped at 6
         base_dir = Path(getattr(sys, "_MEIPASS", str(Path(__file__).resolve().parent.parent)))
         logo_path = base_dir / "LOGO.png"
         if logo_path.exists():
-            pix = QPixmap(str(logo_path))
+            pix = self._load_cached_pixmap(logo_path, "logo")
             if not pix.isNull():
                 self._logo_pixmap = pix
                 logo_label.setPixmap(pix.scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
@@ -619,8 +1295,10 @@ class MainWindow(QMainWindow):
         self._space_shortcut.activated.connect(self._toggle_playback)
 
     def resizeEvent(self, event):
+        # Coalesce the flood of per-pixel resize events into one layout pass;
+        # showEvent still runs the layout synchronously for first paint.
         try:
-            self._update_responsive_layout()
+            self._responsive_timer.start()
         except Exception:
             pass
 
@@ -644,18 +1322,24 @@ class MainWindow(QMainWindow):
 
     def _compute_ui_scale(self) -> float:
         try:
-            w = float(self.width())
-            h = float(self.height())
+            w = int(self.width())
+            h = int(self.height())
         except Exception:
             return 1.0
 
+        key = (w, h)
+        if key == self._last_size_for_scale:
+            return self._last_scale
+
         base_w = 1342.0
         base_h = 967.0
         s = min(w / base_w, h / base_h)
-        if not np.isfinite(s):
+        if not math.isfinite(s):
             s = 1.0
         s = max(0.70, min(1.0, float(s)))
-        return float(s)
+        self._last_size_for_scale = key
+        self._last_scale = s
+        return s
 
     def _schedule_ui_scale_update(self):
         target = self._compute_ui_scale()
@@ -685,69 +1369,62 @@ class MainWindow(QMainWindow):
     def _apply_ui_scale(self):
         s = float(getattr(self, "_ui_scale", 1.0) or 1.0)
 
+        # Resolved once into locals and applied under a single guard: the
+        # updates are ordered cheapest-first and share the scale locals.
         try:
             base = self._base_app_font
             if base is not None:
-                f = base
-                try:
-                    f = base.__class__(base)
-                except Exception:
-                    pass
-                try:
-                    size = float(f.pointSizeF())
-                    if size > 0:
-                        f.setPointSizeF(max(8.0, size * s))
-                        QApplication.setFont(f)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
-        try:
-            if getattr(self, "_main_layout", None) is not None:
-                sp = max(6, int(round(10 * s)))
+                f = base.__class__(base)
+                size = float(f.pointSizeF())
+                if size > 0:
+                    f.setPointSizeF(max(8.0, size * s))
+                    QApplication.setFont(f)
+
+            ml = getattr(self, "_main_layout", None)
+            if ml is not None:
                 mg = max(6, int(round(10 * s)))
-                self._main_layout.setSpacing(int(sp))
-                self._main_layout.setContentsMargins(int(mg), int(mg), int(mg), int(mg))
-        except Exception:
-            pass
+                ml.setSpacing(mg)
+                ml.setContentsMargins(mg, mg, mg, mg)
 
-        try:
             logo = getattr(self, "_logo_label", None)
             pix = getattr(self, "_logo_pixmap", None)
             if logo is not None:
                 side = max(44, int(round(72 * s)))
-                logo.setFixedSize(int(side), int(side))
+                logo.setFixedSize(side, side)
                 if pix is not None:
                     inner = max(36, int(round(64 * s)))
-                    logo.setPixmap(pix.scaled(int(inner), int(inner), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-        except Exception:
-            pass
+                    if abs(inner - 64) <= 1:
+                        # Near-identity target: the source is already 64 px,
+                        # skip the resample entirely.
+                        logo.setPixmap(pix)
+                    else:
+                        scaled = self._logo_scaled_cache.get(inner)
+                        if scaled is None:
+                            # Bilinear filtering only pays off for noticeable
+                            # downscales; near 1.0 nearest-neighbour is
+                            # indistinguishable and much cheaper.
+                            mode = (
+                                Qt.TransformationMode.FastTransformation
+                                if s > 0.9
+                                else Qt.TransformationMode.SmoothTransformation
+                            )
+                            scaled = pix.scaled(inner, inner, Qt.AspectRatioMode.KeepAspectRatio, mode)
+                            while len(self._logo_scaled_cache) >= 6:
+                                self._logo_scaled_cache.pop(next(iter(self._logo_scaled_cache)))
+                            self._logo_scaled_cache[inner] = scaled
+                        logo.setPixmap(scaled)
+
+            roll_w = max(60, int(round(80 * s)))
+            self.piano_roll.setMinimumWidth(roll_w)
+            self.piano_roll.setMaximumWidth(roll_w)
 
-        try:
-            w = max(60, int(round(80 * s)))
-            self.piano_roll.setMinimumWidth(int(w))
-            self.piano_roll.setMaximumWidth(int(w))
-        except Exception:
-            pass
-
-        try:
             self.waveform_widget.setMinimumWidth(max(320, int(round(520 * s))))
             self.waveform_widget.setMinimumHeight(max(160, int(round(240 * s))))
-        except Exception:
-            pass
 
-        try:
-            self.settings_panel.setMinimumWidth(max(280, int(round(420 * s))))
-        except Exception:
-            pass
+            panel_w = max(280, int(round(420 * s)))
+            self.settings_panel.setMinimumWidth(panel_w)
+            self._settings_scroll.setMinimumWidth(panel_w)
 
-        try:
-            self._settings_scroll.setMinimumWidth(max(280, int(round(420 * s))))
-        except Exception:
-            pass
-
-        try:
             self._apply_theme()
         except Exception:
             pass
@@ -814,11 +1491,10 @@ class MainWindow(QMainWindow):
         self._waveform_fade_phase = None
         self._waveform_fade_target_view = None
 
-        self._waveform_opacity_effect = QGraphicsOpacityEffect(self.waveform_widget)
-        self._waveform_opacity_effect.setOpacity(1.0)
-        self.waveform_widget.setGraphicsEffect(self._waveform_opacity_effect)
-
-        self._waveform_fade_anim = QPropertyAnimation(self._waveform_opacity_effect, b"opacity", self)
+        # The waveform fade drives the widget's own pen/brush alpha rather
+        # than a QGraphicsOpacityEffect: the effect would force the whole
+        # pyqtgraph plot into an offscreen pixmap on every animation frame.
+        self._waveform_fade_anim = QPropertyAnimation(self.waveform_widget, b"waveform_alpha", self)
         self._waveform_fade_anim.setEasingCurve(QEasingCurve.Type.InOutCubic)
         self._waveform_fade_anim.setDuration(140)
         self._waveform_fade_anim.finished.connect(self._on_waveform_fade_finished)
@@ -828,10 +1504,21 @@ class MainWindow(QMainWindow):
         self._processing_opacity_effect.setOpacity(0.0 if not self.processing_label.isVisible() else 1.0)
         self.processing_label.setGraphicsEffect(self._processing_opacity_effect)
 
-        self._processing_fade_anim = QPropertyAnimation(self._processing_opacity_effect, b"opacity", self)
-        self._processing_fade_anim.setEasingCurve(QEasingCurve.Type.InOutCubic)
-        self._processing_fade_anim.setDuration(160)
-        self._processing_fade_anim.finished.connect(self._on_processing_fade_finished)
+        # Pre-built with baked values so show/hide only stop() + start();
+        # the out-fade leaves its start unset and picks up the current
+        # opacity when started.
+        self._processing_fade_in = QPropertyAnimation(self._processing_opacity_effect, b"opacity", self)
+        self._processing_fade_in.setEasingCurve(QEasingCurve.Type.InOutCubic)
+        self._processing_fade_in.setDuration(160)
+        self._processing_fade_in.setStartValue(0.0)
+        self._processing_fade_in.setEndValue(1.0)
+        self._processing_fade_in.finished.connect(self._on_processing_fade_finished)
+
+        self._processing_fade_out = QPropertyAnimation(self._processing_opacity_effect, b"opacity", self)
+        self._processing_fade_out.setEasingCurve(QEasingCurve.Type.InOutCubic)
+        self._processing_fade_out.setDuration(140)
+        self._processing_fade_out.setEndValue(0.0)
+        self._processing_fade_out.finished.connect(self._on_processing_fade_finished)
 
     def _on_waveform_fade_finished(self):
         phase = getattr(self, "_waveform_fade_phase", None)
@@ -845,12 +1532,12 @@ class MainWindow(QMainWindow):
             self._waveform_fade_phase = "in"
             try:
                 self._waveform_fade_anim.setDuration(160)
-                self._waveform_fade_anim.setStartValue(0.0)
-                self._waveform_fade_anim.setEndValue(1.0)
+                self._waveform_fade_anim.setStartValue(0)
+                self._waveform_fade_anim.setEndValue(255)
                 self._waveform_fade_anim.start()
             except Exception:
                 try:
-                    self._waveform_opacity_effect.setOpacity(1.0)
+                    self.waveform_widget.waveform_alpha = 255
                 except Exception:
                     pass
                 self._waveform_fade_phase = None
@@ -861,93 +1548,68 @@ class MainWindow(QMainWindow):
         self._waveform_fade_target_view = None
 
     def _show_processing_label(self, text: str):
-        try:
-            self.processing_label.setText(str(text))
-        except Exception:
-            pass
-
-        was_visible = False
-        try:
-            was_visible = bool(self.processing_label.isVisible())
-        except Exception:
-            was_visible = False
-
-        anim = getattr(self, "_processing_fade_anim", None)
+        # One guard around the whole sequence; the per-call try blocks this
+        # replaces only ever failed together (label or animation torn down).
+        fade_in = getattr(self, "_processing_fade_in", None)
+        fade_out = getattr(self, "_processing_fade_out", None)
         fx = getattr(self, "_processing_opacity_effect", None)
         try:
-            if anim is not None and anim.state() != QAbstractAnimation.State.Stopped:
-                anim.stop()
-        except Exception:
-            pass
+            label = self.processing_label
+            label.setText(str(text))
 
-        try:
-            self.processing_label.setVisible(True)
-        except Exception:
-            pass
+            visible = bool(label.isVisible())
+            for anim in (fade_in, fade_out):
+                if anim is not None and anim.state() != QAbstractAnimation.State.Stopped:
+                    anim.stop()
+            label.setVisible(True)
 
-        if was_visible:
-            try:
+            if visible:
                 self._processing_fade_mode = None
                 if fx is not None:
                     fx.setOpacity(1.0)
-            except Exception:
-                pass
-            return
+                    fx.setEnabled(False)
+                return
 
-        if anim is None or fx is None:
-            return
+            if fade_in is None or fx is None:
+                return
 
-        try:
-            anim.stop()
-        except Exception:
-            pass
-        try:
             self._processing_fade_mode = "show"
+            fx.setEnabled(True)
             fx.setOpacity(0.0)
-            anim.setDuration(160)
-            anim.setStartValue(0.0)
-            anim.setEndValue(1.0)
-            anim.start()
+            fade_in.start()
         except Exception:
             self._processing_fade_mode = None
             try:
-                fx.setOpacity(1.0)
+                if fx is not None:
+                    fx.setOpacity(1.0)
+                    fx.setEnabled(False)
             except Exception:
                 pass
 
     def _hide_processing_label(self):
+        fade_in = getattr(self, "_processing_fade_in", None)
+        fade_out = getattr(self, "_processing_fade_out", None)
+        fx = getattr(self, "_processing_opacity_effect", None)
         try:
-            if not self.processing_label.isVisible():
+            label = self.processing_label
+            if not label.isVisible():
                 return
-        except Exception:
-            return
 
-        anim = getattr(self, "_processing_fade_anim", None)
-        fx = getattr(self, "_processing_opacity_effect", None)
-        if anim is None or fx is None:
-            try:
-                self.processing_label.setVisible(False)
-            except Exception:
-                pass
-            return
-
-        try:
-            if anim.state() != QAbstractAnimation.State.Stopped:
-                anim.stop()
-        except Exception:
-            pass
+            if fade_out is None or fx is None:
+                label.setVisible(False)
+                return
 
-        try:
-            start = float(fx.opacity())
-        except Exception:
-            start = 1.0
+            for anim in (fade_in, fade_out):
+                if anim is not None and anim.state() != QAbstractAnimation.State.Stopped:
+                    anim.stop()
 
-        try:
             self._processing_fade_mode = "hide"
-            anim.setDuration(140)
-            anim.setStartValue(start)
-            anim.setEndValue(0.0)
-            anim.start()
+            if not fx.isEnabled():
+                # At rest the effect is bypassed; restore it at full opacity
+                # before the out-fade starts from there.
+                fx.setOpacity(1.0)
+                fx.setEnabled(True)
+            fade_out.start()
         except Exception:
             self._processing_fade_mode = None
             try:
@@ -962,6 +1624,13 @@ class MainWindow(QMainWindow):
                 self.processing_label.setVisible(False)
             except Exception:
                 pass
+        elif mode == "show":
+            # Fully opaque: disable the effect so the label paints directly
+            # instead of through the offscreen effect pipeline.
+            try:
+                self._processing_opacity_effect.setEnabled(False)
+            except Exception:
+                pass
         self._processing_fade_mode = None
 
     def _setup_menu(self):
@@ -984,19 +1653,21 @@ class MainWindow(QMainWindow):
         self._action_show_loading = QAction(tr("ui.menu.options.show_loading_dialog", "Show Loading Dialog"), self)
         self._action_show_loading.setCheckable(True)
         self._action_show_loading.setChecked(bool(self._show_loading_dialog))
-        self._action_show_loading.toggled.connect(self._set_show_loading_dialog)
+        self._bind_bool_option(self._action_show_loading, "_show_loading_dialog")
         self._options_menu.addAction(self._action_show_loading)
 
         self._action_performance_mode = QAction(tr("ui.menu.options.performance_mode", "Performance Mode"), self)
         self._action_performance_mode.setCheckable(True)
         self._action_performance_mode.setChecked(bool(self._performance_mode))
-        self._action_performance_mode.toggled.connect(self._set_performance_mode)
+        self._bind_bool_option(
+            self._action_performance_mode, "_performance_mode", self._apply_performance_mode
+        )
         self._options_menu.addAction(self._action_performance_mode)
 
         self._action_warmup = QAction(tr("ui.menu.options.warmup_enabled", "Warm Up Audio Engine on Startup"), self)
         self._action_warmup.setCheckable(True)
         self._action_warmup.setChecked(bool(self._warmup_enabled))
-        self._action_warmup.toggled.connect(self._set_warmup_enabled)
+        self._bind_bool_option(self._action_warmup, "_warmup_enabled", self._on_warmup_enabled_changed)
         self._options_menu.addAction(self._action_warmup)
 
         self._language_menu = self._options_menu.addMenu(tr("ui.menu.language", "Language"))
@@ -1117,30 +1788,35 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-    def _set_show_loading_dialog(self, enabled: bool):
-        self._show_loading_dialog = bool(enabled)
+    def _bind_bool_option(self, action: QAction, attr: str, on_change=None):
+        # One shared slot for every checkable Options entry; the attribute
+        # name rides along in the partial instead of a per-option method.
+        action.toggled.connect(partial(self._set_bool_option, attr, on_change))
+
+    def _set_bool_option(self, attr: str, on_change, enabled: bool):
+        enabled = bool(enabled)
+        if getattr(self, attr) == enabled:
+            return
+        setattr(self, attr, enabled)
         self._schedule_save_settings()
+        if on_change is not None:
+            on_change(enabled)
 
-    def _set_performance_mode(self, enabled: bool):
-        self._performance_mode = bool(enabled)
+    def _apply_performance_mode(self, enabled: bool):
+        # Startup calls this directly with the persisted value to push it
+        # down without scheduling a save.
         try:
             self.waveform_widget.set_performance_mode(bool(enabled))
         except Exception:
             pass
 
         try:
-            self._processing_debounce_timer.setInterval(1000 if self._performance_mode else 600)
+            self._processing_debounce_timer.setInterval(1000 if bool(enabled) else 600)
         except Exception:
             pass
 
-        self._schedule_save_settings()
-
-    def _set_warmup_enabled(self, enabled: bool):
-        self._warmup_enabled = bool(enabled)
-
-        self._schedule_save_settings()
-
-        if not self._warmup_enabled:
+    def _on_warmup_enabled_changed(self, enabled: bool):
+        if not enabled:
             if self._warmup_thread is not None and self._warmup_thread.isRunning():
                 try:
                     self._warmup_thread.requestInterruption()
@@ -1157,6 +1833,12 @@ class MainWindow(QMainWindow):
         if bool(self._warmup_done):
             return
 
+        marker = _warmup_marker_path()
+        if marker is not None and marker.exists():
+            # A previous launch already primed the on-disk JIT caches.
+            self._warmup_done = True
+            return
+
         if self.original_audio is not None:
             return
 
@@ -1180,6 +1862,13 @@ class MainWindow(QMainWindow):
 
     def _on_warmup_finished(self):
         self._warmup_done = True
+        marker = _warmup_marker_path()
+        if marker is not None:
+            try:
+                marker.parent.mkdir(parents=True, exist_ok=True)
+                marker.touch()
+            except OSError:
+                pass
         try:
             self.statusBar().clearMessage()
         except Exception:
@@ -1192,29 +1881,50 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    @pyqtSlot(int)
+    def _on_octave_spin_changed(self, _value: int):
+        self._sync_debounce_timer.start()
+
+    @pyqtSlot(str)
+    def _on_note_combo_changed(self, _text: str):
+        self._sync_debounce_timer.start()
+
     def _connect_signals(self):
-        """Connect all signals and slots."""
-        self.settings_panel.export_clicked.connect(self._on_export)
-        self.settings_panel.quick_export_clicked.connect(self._on_quick_export)
-        self.settings_panel.settings_changed.connect(self._on_settings_changed)
-        self.settings_panel.themes_requested.connect(self._open_theme_editor)
-        self.settings_panel.octave_spin.valueChanged.connect(self._sync_piano_roll_to_settings)
-        self.settings_panel.note_combo.currentTextChanged.connect(lambda _t: self._sync_piano_roll_to_settings())
-        self.waveform_widget.blob_note_changed.connect(self._on_waveform_blob_note_changed)
-        self.waveform_widget.midi_view_range_changed.connect(self.piano_roll.set_midi_range)
+        """Connect all signals and slots; idempotent via UniqueConnection.
+
+        Named slots instead of lambdas: a lambda has a fresh identity on
+        every call, so a repeated _connect_signals would stack duplicates
+        that UniqueConnection cannot detect.
+        """
+        unique = Qt.ConnectionType.UniqueConnection
+        pairs = (
+            (self.settings_panel.export_clicked, self._on_export),
+            (self.settings_panel.quick_export_clicked, self._on_quick_export),
+            (self.settings_panel.settings_changed, self._on_settings_changed),
+            (self.settings_panel.themes_requested, self._open_theme_editor),
+            (self.settings_panel.octave_spin.valueChanged, self._on_octave_spin_changed),
+            (self.settings_panel.note_combo.currentTextChanged, self._on_note_combo_changed),
+            (self.waveform_widget.blob_note_changed, self._on_waveform_blob_note_changed),
+            (self.waveform_widget.midi_view_range_changed, self.piano_roll.set_midi_range),
+        )
+        for signal, slot in pairs:
+            try:
+                signal.connect(slot, unique)
+            except TypeError:
+                # Raised when the pair is already connected.
+                pass
 
     def _default_theme(self) -> dict:
-        return {
-            "bg": "#2E2E2E",
-            "panel": "#404040",
-            "primary": "#1D5AAA",
-            "accent": "#33CED6",
-            "highlight": "#6B999F",
-            "success": "#4EDE83",
-            "text": "#ffffff",
-        }
+        return dict(_DEFAULT_THEME)
 
     def _read_theme(self) -> dict:
+        # QSettings reads hit the backing store (the registry on Windows);
+        # after the first parse the theme lives in memory and every writer
+        # (_on_theme_applied) keeps the cache current.
+        cached = getattr(self, "_theme_cache", None)
+        if cached is not None:
+            return dict(cached)
+
         theme = self._default_theme()
         try:
             raw = self._qsettings.value("theme/json", "", type=str)
@@ -1227,32 +1937,48 @@ class MainWindow(QMainWindow):
                         theme[str(k)] = str(v)
         except Exception:
             pass
+        self._theme_cache = dict(theme)
         return theme
 
     def _open_theme_editor(self):
+        if self._theme_editor is not None and self._theme_editor.isVisible():
+            # Already open: just bring it forward, no library I/O.
+            try:
+                self._theme_editor.raise_()
+                self._theme_editor.activateWindow()
+            except Exception:
+                pass
+            return
+
         try:
             themes = self._load_theme_library()
         except Exception:
             themes = {}
 
         if self._theme_editor is None:
+            # The editor copies what it is handed, so pass by reference.
             self._theme_editor = ThemeEditorWindow(
                 self,
-                theme=dict(self._theme),
-                themes=dict(themes),
+                theme=self._theme,
+                themes=themes,
                 themes_dir=str(self._get_user_themes_dir()),
             )
             self._theme_editor.theme_applied.connect(self._on_theme_applied)
         else:
             try:
-                self._theme_editor.set_theme(dict(self._theme))
+                self._theme_editor.set_theme(self._theme)
             except Exception:
                 pass
 
-            try:
-                self._theme_editor.set_available_themes(dict(themes))
-            except Exception:
-                pass
+            # Only repopulate the themes list when the on-disk library
+            # actually changed since the editor last saw it.
+            if self._theme_lib_sig != self._theme_editor_lib_sig:
+                try:
+                    self._theme_editor.set_available_themes(themes)
+                except Exception:
+                    pass
+
+        self._theme_editor_lib_sig = self._theme_lib_sig
 
         try:
             self._theme_editor.show()
@@ -1274,8 +2000,6 @@ class MainWindow(QMainWindow):
         return d
 
     def _load_theme_library(self) -> dict:
-        themes: dict[str, dict] = {}
-
         candidates: list[Path] = []
         try:
             candidates.append(self._get_resource_base_dir() / "themes")
@@ -1286,33 +2010,66 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+        # One scandir pass per folder collects the candidate files and a
+        # freshness signature (newest mtime + file count, so deletions also
+        # invalidate). When nothing changed since the last call, the parsed
+        # library is reused instead of re-reading every theme file.
+        json_paths: list[Path] = []
+        sig_parts: list[tuple[str, int, int]] = []
         for folder in candidates:
+            newest = 0
+            count = 0
+            entries: list[tuple[str, Path]] = []
             try:
-                if not folder.exists():
-                    continue
-                for p in sorted(folder.glob("*.json")):
-                    try:
-                        raw = p.read_text(encoding="utf-8")
-                        obj = json.loads(raw)
-                        if not isinstance(obj, dict):
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if not entry.name.endswith(".json"):
                             continue
-                        name = str(obj.get("name") or p.stem)
-                        colors = obj.get("colors")
-                        if isinstance(colors, dict):
-                            theme_dict = {str(k): str(v) for k, v in colors.items() if v is not None}
-                        else:
-                            theme_dict = {str(k): str(v) for k, v in obj.items() if v is not None and k != "name"}
-
-                        if theme_dict:
-                            themes[name] = theme_dict
-                    except Exception:
-                        continue
+                        try:
+                            if not entry.is_file():
+                                continue
+                            mt = int(entry.stat().st_mtime_ns)
+                        except OSError:
+                            continue
+                        count += 1
+                        if mt > newest:
+                            newest = mt
+                        entries.append((entry.name, Path(entry.path)))
+            except OSError:
+                pass
+            entries.sort()
+            json_paths.extend(p for _name, p in entries)
+            sig_parts.append((str(folder), newest, count))
+
+        sig = tuple(sig_parts)
+        cached = getattr(self, "_theme_lib_cache", None)
+        if cached is not None and sig == getattr(self, "_theme_lib_sig", None):
+            return cached
+
+        themes: dict[str, dict] = {}
+        for p in json_paths:
+            try:
+                raw = p.read_text(encoding="utf-8")
+                obj = json.loads(raw)
+                if not isinstance(obj, dict):
+                    continue
+                name = str(obj.get("name") or p.stem)
+                colors = obj.get("colors")
+                if isinstance(colors, dict):
+                    theme_dict = {str(k): str(v) for k, v in colors.items() if v is not None}
+                else:
+                    theme_dict = {str(k): str(v) for k, v in obj.items() if v is not None and k != "name"}
+
+                if theme_dict:
+                    themes[name] = theme_dict
             except Exception:
                 continue
 
         if "Default" not in themes:
-            themes["Default"] = dict(self._default_theme())
+            themes["Default"] = dict(_DEFAULT_THEME)
 
+        self._theme_lib_sig = sig
+        self._theme_lib_cache = themes
         return themes
 
     def _on_theme_applied(self, theme: dict):
@@ -1324,33 +2081,34 @@ class MainWindow(QMainWindow):
             if v is None:
                 continue
             base[str(k)] = str(v)
+
+        # Re-applying the current theme (clicking it again in the editor) is
+        # a no-op: skip the restyle and the settings write.
+        theme_json = json.dumps(base, sort_keys=True, separators=(",", ":"))
+        if theme_json == getattr(self, "_theme_json", None):
+            return
+        self._theme_json = theme_json
         self._theme = base
+        self._theme_cache = dict(base)
 
         self._apply_theme()
 
         try:
-            self._qsettings.setValue("theme/json", json.dumps(self._theme))
+            self._qsettings.setValue("theme/json", theme_json)
         except Exception:
             pass
 
     def _midi_to_note_and_octave(self, midi: int) -> tuple[str, int]:
-        note_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-        m = int(midi)
-        note = note_names[m % 12]
-        octave = (m // 12) - 1
-        return note, int(octave)
+        return _MIDI_NOTE_TABLE[int(midi) & 0x7F]
 
     def _set_target_midi(self, midi: int, schedule_processing: bool, immediate: bool):
         note, octave = self._midi_to_note_and_octave(midi)
 
-        self.settings_panel.note_combo.blockSignals(True)
-        self.settings_panel.octave_spin.blockSignals(True)
-        self.settings_panel.note_combo.setCurrentText(note)
-        self.settings_panel.octave_spin.setValue(int(octave))
-        self.settings_panel.note_combo.blockSignals(False)
-        self.settings_panel.octave_spin.blockSignals(False)
+        with QSignalBlocker(self.settings_panel.note_combo), QSignalBlocker(self.settings_panel.octave_spin):
+            self.settings_panel.note_combo.setCurrentText(note)
+            self.settings_panel.octave_spin.setValue(int(octave))
 
-        freq = 440.0 * (2 ** ((float(midi) - 69.0) / 12.0))
+        freq = _MIDI_FREQ[int(midi) & 0x7F]
         self.settings_panel.target_label.setText(f"Target: {note}{octave} ({freq:.2f} Hz)")
 
         self._sync_piano_roll_to_settings()
@@ -1364,6 +2122,20 @@ class MainWindow(QMainWindow):
     def _apply_theme(self):
         """Apply dark theme to the application."""
         t = self._theme if isinstance(getattr(self, "_theme", None), dict) else {}
+
+        # Rebuilding the stylesheet is cheap compared to what setStyleSheet
+        # triggers: Qt reparses the QSS and re-polishes every child widget.
+        # Skip the whole pass when neither the theme nor the scale changed.
+        try:
+            key = (
+                tuple(sorted((str(k), str(v)) for k, v in t.items())),
+                round(float(getattr(self, "_ui_scale", 1.0) or 1.0), 3),
+            )
+        except Exception:
+            key = None
+        if key is not None and key == getattr(self, "_last_qss_key", None):
+            return
+
         bg = str(t.get("bg", "#2E2E2E"))
         panel = str(t.get("panel", "#404040"))
         primary = str(t.get("primary", "#1D5AAA"))
@@ -1378,10 +2150,6 @@ class MainWindow(QMainWindow):
                 c = QColor(str(fallback))
             return c
 
-        def _rgba(c: QColor, alpha: int) -> str:
-            a = max(0, min(255, int(alpha)))
-            return f"rgba({c.red()}, {c.green()}, {c.blue()}, {a})"
-
         bg_c = _qcolor(bg, "#2E2E2E")
         panel_c = _qcolor(panel, "#404040")
         primary_c = _qcolor(primary, "#1D5AAA")
@@ -1400,10 +2168,14 @@ class MainWindow(QMainWindow):
 
         panel_2 = panel_c.darker(110).name()
         panel_hover = panel_c.lighter(112).name()
-        border_subtle = _rgba(text_c, 34)
-        border_hover = _rgba(text_c, 70)
-        text_muted = _rgba(text_c, 180)
-        text_disabled = _rgba(text_c, 110)
+
+        # Pull the channel ints out once; the rgba() variants below would
+        # otherwise each make three QColor accessor round-trips.
+        text_r, text_g, text_b = text_c.red(), text_c.green(), text_c.blue()
+        border_subtle = f"rgba({text_r}, {text_g}, {text_b}, 34)"
+        border_hover = f"rgba({text_r}, {text_g}, {text_b}, 70)"
+        text_muted = f"rgba({text_r}, {text_g}, {text_b}, 180)"
+        text_disabled = f"rgba({text_r}, {text_g}, {text_b}, 110)"
 
         try:
             s = float(getattr(self, "_ui_scale", 1.0) or 1.0)
@@ -1441,305 +2213,88 @@ class MainWindow(QMainWindow):
         scrollbar_thick = _px(12, 10)
         scrollbar_rad = _px(6, 5)
 
-        self.setStyleSheet(
-            "QMainWindow, QWidget {"
-            f"background-color: {bg};"
-            f"color: {text};"
-            f"selection-background-color: {primary};"
-            f"selection-color: {text};"
-            f"font-size: {font_px}px;"
-            "}"
-            "QWidget:disabled {"
-            f"color: {text_disabled};"
-            "}"
-            "QLabel {"
-            "background: transparent;"
-            "}"
-            "QToolTip {"
-            f"background-color: {panel};"
-            f"color: {text};"
-            f"border: 1px solid {border_subtle};"
-            f"padding: {menu_pad}px {pad_x_sm}px;"
-            f"border-radius: {radius_sm}px;"
-            "}"
-            "QMenuBar {"
-            f"background-color: {bg};"
-            f"color: {text};"
-            f"padding: {_px(4, 2)}px;"
-            "}"
-            "QMenuBar::item {"
-            "background: transparent;"
-            f"padding: {pad_y_sm}px {pad_x_sm}px;"
-            f"margin: {_px(2, 1)}px {tab_margin_x}px;"
-            f"border-radius: {radius_sm}px;"
-            "}"
-            "QMenuBar::item:selected {"
-            f"background: {panel};"
-            "}"
-            "QMenu {"
-            f"background-color: {panel};"
-            f"border: 1px solid {border_subtle};"
-            f"color: {text};"
-            f"padding: {menu_pad}px;"
-            "}"
-            "QMenu::item {"
-            f"padding: {menu_item_y}px {menu_item_right}px {menu_item_y}px {menu_item_left}px;"
-            f"border-radius: {radius_sm}px;"
-            "background: transparent;"
-            "}"
-            "QMenu::item:selected {"
-            f"background: {highlight};"
-            f"color: {text};"
-            "}"
-            "QMenu::separator {"
-            "height: 1px;"
-            f"background: {border_subtle};"
-            f"margin: {menu_pad}px {pad_x_sm}px;"
-            "}"
-            "QTabWidget::pane {"
-            f"border: 1px solid {border_subtle};"
-            f"border-radius: {radius_md}px;"
-            "top: -1px;"
-            "}"
-            "QTabBar::tab {"
-            "background: transparent;"
-            f"padding: {tab_pad_y}px {tab_pad_x}px;"
-            f"margin: {tab_margin_y}px {tab_margin_x}px;"
-            f"border-radius: {_px(9, 6)}px;"
-            f"color: {text_muted};"
-            "}"
-            "QTabBar::tab:hover {"
-            f"background: {panel_2};"
-            f"color: {text};"
-            "}"
-            "QTabBar::tab:selected {"
-            f"background: {panel};"
-            f"color: {text};"
-            "}"
-            "QGroupBox {"
-            f"background-color: {panel_2};"
-            f"border: 1px solid {border_subtle};"
-            f"border-radius: {_px(12, 8)}px;"
-            f"margin-top: {group_margin_top}px;"
-            f"padding: {group_padding}px;"
-            "}"
-            "QGroupBox::title {"
-            "subcontrol-origin: margin;"
-            "subcontrol-position: top left;"
-            f"left: {_px(12, 8)}px;"
-            f"padding: 0 {menu_pad}px;"
-            "background: transparent;"
-            "border: none;"
-            "}"
-            "QLineEdit, QTextEdit, QPlainTextEdit {"
-            f"background-color: {panel};"
-            f"border: 1px solid {border_subtle};"
-            f"border-radius: {radius_md}px;"
-            f"padding: {pad_y_sm}px {pad_x_sm}px;"
-            f"color: {text};"
-            "}"
-            "QLineEdit:hover, QTextEdit:hover, QPlainTextEdit:hover {"
-            f"border-color: {border_hover};"
-            "}"
-            "QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {"
-            f"border-color: {accent};"
-            "}"
-            "QPushButton {"
-            f"background-color: {panel};"
-            f"border: 1px solid {border_subtle};"
-            f"border-radius: {radius_md}px;"
-            f"padding: {pad_y_btn}px {pad_x_btn}px;"
-            f"color: {text};"
-            "}"
-            "QPushButton:hover {"
-            f"background-color: {panel_hover};"
-            f"border-color: {border_hover};"
-            "}"
-            "QPushButton:pressed {"
-            f"background-color: {panel_2};"
-            f"border-color: {primary};"
-            "}"
-            "QPushButton:disabled {"
-            f"background-color: {panel_2};"
-            f"border-color: {border_subtle};"
-            f"color: {text_disabled};"
-            "}"
-            "QComboBox {"
-            f"background-color: {panel};"
-            f"border: 1px solid {border_subtle};"
-            f"border-radius: {radius_md}px;"
-            f"padding: {pad_y_sm}px {pad_x_sm}px;"
-            f"color: {text};"
-            "}"
-            "QComboBox:hover {"
-            f"border-color: {border_hover};"
-            "}"
-            "QComboBox:focus {"
-            f"border-color: {accent};"
-            "}"
-            "QComboBox::drop-down {"
-            "border: none;"
-            f"width: {_px(28, 22)}px;"
-            "}"
-            "QComboBox QAbstractItemView {"
-            f"background-color: {panel};"
-            f"color: {text};"
-            f"border: 1px solid {border_subtle};"
-            "outline: 0;"
-            f"selection-background-color: {highlight};"
-            "}"
-            "QAbstractItemView::item {"
-            f"padding: {menu_item_y}px {pad_x_sm}px;"
-            f"border-radius: {radius_sm}px;"
-            "}"
-            "QSpinBox, QDoubleSpinBox {"
-            f"background-color: {panel};"
-            f"border: 1px solid {border_subtle};"
-            f"border-radius: {radius_md}px;"
-            f"padding: {pad_y_sm}px {pad_x_sm}px;"
-            f"color: {text};"
-            "}"
-            "QSpinBox:hover, QDoubleSpinBox:hover {"
-            f"border-color: {border_hover};"
-            "}"
-            "QSpinBox:focus, QDoubleSpinBox:focus {"
-            f"border-color: {accent};"
-            "}"
-            "QSpinBox::up-button, QDoubleSpinBox::up-button, QSpinBox::down-button, QDoubleSpinBox::down-button {"
-            f"width: {_px(18, 14)}px;"
-            "border: none;"
-            "background: transparent;"
-            "}"
-            "QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover, QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {"
-            f"background: {panel_2};"
-            "border-radius: 8px;"
-            "}"
-            "QSlider {"
-            "background: transparent;"
-            "border: none;"
-            "outline: none;"
-            "}"
-            "QSlider:focus {"
-            "border: none;"
-            "outline: none;"
-            "}"
-            "QSlider::groove:horizontal {"
-            f"background: {panel_2};"
-            "border: none;"
-            f"height: {slider_groove_h}px;"
-            f"border-radius: {_px(4, 3)}px;"
-            "}"
-            "QSlider::sub-page:horizontal {"
-            f"background: {accent};"
-            "border: none;"
-            "border-radius: 4px;"
-            "}"
-            "QSlider::add-page:horizontal {"
-            f"background: {panel_2};"
-            "border: none;"
-            "border-radius: 4px;"
-            "}"
-            "QSlider::handle:horizontal {"
-            f"background: {text};"
-            f"width: {slider_handle_w}px;"
-            f"margin: {-_px(4, 3)}px 0;"
-            f"border-radius: {radius_sm}px;"
-            f"border: 2px solid {accent};"
-            "outline: none;"
-            "}"
-            "QSlider::handle:horizontal:hover {"
-            f"border-color: {primary};"
-            "}"
-            "QSlider::handle:horizontal:pressed {"
-            f"border-color: {success};"
-            "}"
-            "QCheckBox {"
-            f"spacing: {menu_item_y}px;"
-            "background: transparent;"
-            "}"
-            "QCheckBox:hover {"
-            f"color: {text};"
-            "}"
-            "QCheckBox::indicator {"
-            f"width: {checkbox_ind}px;"
-            f"height: {checkbox_ind}px;"
-            f"border-radius: {checkbox_rad}px;"
-            f"border: 1px solid {border_subtle};"
-            f"background-color: {panel};"
-            "}"
-            "QCheckBox::indicator:hover {"
-            f"border-color: {border_hover};"
-            "}"
-            "QCheckBox::indicator:checked {"
-            f"background-color: {accent};"
-            f"border-color: {accent};"
-            "}"
-            "QCheckBox::indicator:checked:hover {"
-            f"background-color: {primary};"
-            f"border-color: {primary};"
-            "}"
-            "QScrollBar:vertical {"
-            "background: transparent;"
-            f"width: {scrollbar_thick}px;"
-            "margin: 0px;"
-            "}"
-            "QScrollBar::handle:vertical {"
-            f"background: {panel_hover};"
-            f"border-radius: {scrollbar_rad}px;"
-            f"min-height: {_px(28, 20)}px;"
-            "}"
-            "QScrollBar::handle:vertical:hover {"
-            f"background: {highlight};"
-            "}"
-            "QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {"
-            "height: 0px;"
-            "}"
-            "QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {"
-            "background: transparent;"
-            "}"
-            "QScrollBar:horizontal {"
-            "background: transparent;"
-            f"height: {scrollbar_thick}px;"
-            "margin: 0px;"
-            "}"
-            "QScrollBar::handle:horizontal {"
-            f"background: {panel_hover};"
-            f"border-radius: {scrollbar_rad}px;"
-            f"min-width: {_px(28, 20)}px;"
-            "}"
-            "QScrollBar::handle:horizontal:hover {"
-            f"background: {highlight};"
-            "}"
-            "QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {"
-            "width: 0px;"
-            "}"
-            "QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {"
-            "background: transparent;"
-            "}"
-            "QProgressBar {"
-            f"border: 1px solid {border_subtle};"
-            f"border-radius: {radius_md}px;"
-            f"background: {panel_2};"
-            "text-align: center;"
-            f"padding: {_px(2, 1)}px;"
-            "}"
-            "QProgressBar::chunk {"
-            f"background: {primary};"
-            f"border-radius: {radius_sm}px;"
-            "}"
-            "QStatusBar {"
-            f"background: {bg};"
-            f"color: {text_muted};"
-            "}"
-            "QStatusBar::item {"
-            "border: none;"
-            "}"
-        )
+        params = {
+            "bg": bg,
+            "panel": panel,
+            "panel_2": panel_2,
+            "panel_hover": panel_hover,
+            "primary": primary,
+            "accent": accent,
+            "highlight": highlight,
+            "success": success,
+            "text": text,
+            "text_muted": text_muted,
+            "text_disabled": text_disabled,
+            "border_subtle": border_subtle,
+            "border_hover": border_hover,
+            "font_px": font_px,
+            "radius_md": radius_md,
+            "radius_sm": radius_sm,
+            "radius_lg": _px(12, 8),
+            "pad_y_sm": pad_y_sm,
+            "pad_x_sm": pad_x_sm,
+            "pad_y_btn": pad_y_btn,
+            "pad_x_btn": pad_x_btn,
+            "pad_xs": _px(2, 1),
+            "tab_pad_y": tab_pad_y,
+            "tab_pad_x": tab_pad_x,
+            "tab_margin_y": tab_margin_y,
+            "tab_margin_x": tab_margin_x,
+            "tab_radius": _px(9, 6),
+            "group_margin_top": group_margin_top,
+            "group_padding": group_padding,
+            "menubar_pad": _px(4, 2),
+            "menu_pad": menu_pad,
+            "menu_item_y": menu_item_y,
+            "menu_item_left": menu_item_left,
+            "menu_item_right": menu_item_right,
+            "dropdown_w": _px(28, 22),
+            "spin_btn_w": _px(18, 14),
+            "slider_groove_h": slider_groove_h,
+            "slider_handle_w": slider_handle_w,
+            "groove_rad": _px(4, 3),
+            "handle_margin": -_px(4, 3),
+            "checkbox_ind": checkbox_ind,
+            "checkbox_rad": checkbox_rad,
+            "scrollbar_thick": scrollbar_thick,
+            "scrollbar_rad": scrollbar_rad,
+            "scroll_min": _px(28, 20),
+        }
+
+        qss = _QSS_TEMPLATE.format_map(params)
+        if qss != getattr(self, "_last_qss", None):
+            self.setStyleSheet(qss)
+            self._last_qss = qss
+
+        # The control and scrollbar rules live on the widgets they target,
+        # so applying them re-polishes only those subtrees.
+        controls_qss = _QSS_CONTROLS_TEMPLATE.format_map(params)
+        if controls_qss != getattr(self, "_last_controls_qss", None):
+            try:
+                self.settings_panel.setStyleSheet(controls_qss)
+                self._last_controls_qss = controls_qss
+            except Exception:
+                pass
+
+        scroll_qss = _QSS_SCROLLBAR_TEMPLATE.format_map(params)
+        if scroll_qss != getattr(self, "_last_scroll_qss", None):
+            try:
+                self._settings_scroll.setStyleSheet(scroll_qss)
+            except Exception:
+                pass
+            try:
+                if self._debug_text is not None:
+                    self._debug_text.setStyleSheet(scroll_qss)
+            except Exception:
+                pass
+            self._last_scroll_qss = scroll_qss
+
+        self._last_qss_key = key
 
         try:
-            c = QColor(accent)
-            if c.isValid():
-                self.waveform_label.setStyleSheet(f"color: rgba({c.red()}, {c.green()}, {c.blue()}, 170);")
+            self.waveform_label.setStyleSheet(
+                f"color: rgba({accent_c.red()}, {accent_c.green()}, {accent_c.blue()}, 170);"
+            )
         except Exception:
             pass
 
@@ -1758,6 +2313,9 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+        # Pre-rendered so the drag handlers only swap strings.
+        self._waveform_qss_drop = f"border: 2px dashed {accent}; border-radius: 6px;"
+
         try:
             self.piano_roll.apply_theme(dict(self._theme))
         except Exception:
@@ -1772,6 +2330,11 @@ class MainWindow(QMainWindow):
 
         self._debug_text = QTextEdit()
         self._debug_text.setPlaceholderText(tr("ui.placeholder.debug_notes", "Type feedback/approval notes here. Click Save to write to disk."))
+        # The scrollbar rules are scoped per-widget; the dock is created
+        # after the theme was first applied, so pick the sheet up here.
+        scroll_qss = getattr(self, "_last_scroll_qss", None)
+        if scroll_qss:
+            self._debug_text.setStyleSheet(scroll_qss)
         layout.addWidget(self._debug_text)
 
         save_btn = QPushButton(tr("ui.button.save", "Save"))
@@ -1784,14 +2347,56 @@ class MainWindow(QMainWindow):
         self._load_debug_notes()
 
     def _load_debug_notes(self):
+        """Stream the notes file from the pool, applied chunk-wise on the GUI thread.
+
+        Small files (the common case) arrive as a single setPlainText; large
+        ones are appended in 64 KiB chunks so no single layout pass has to
+        swallow a multi-MB document.
+        """
         if not self._debug_notes_path or self._debug_text is None:
             return
-        try:
-            if os.path.exists(self._debug_notes_path):
-                with open(self._debug_notes_path, "r", encoding="utf-8") as f:
-                    self._debug_text.setPlainText(f.read())
-        except Exception:
-            pass
+        path = str(self._debug_notes_path)
+
+        def _queue(method: str, text: str):
+            QMetaObject.invokeMethod(
+                self,
+                method,
+                Qt.ConnectionType.QueuedConnection,
+                Q_ARG(str, text),
+            )
+
+        def _read():
+            try:
+                if not os.path.exists(path):
+                    return
+                small = os.stat(path).st_size <= 4096
+                with open(path, "r", encoding="utf-8") as f:
+                    if small:
+                        _queue("_apply_debug_notes_text", f.read())
+                        return
+                    first = True
+                    while True:
+                        chunk = f.read(65536)
+                        if not chunk:
+                            break
+                        _queue("_apply_debug_notes_text" if first else "_append_debug_notes_text", chunk)
+                        first = False
+            except Exception:
+                pass
+
+        QThreadPool.globalInstance().start(_read)
+
+    @pyqtSlot(str)
+    def _apply_debug_notes_text(self, text: str):
+        if self._debug_text is not None:
+            self._debug_text.setPlainText(text)
+
+    @pyqtSlot(str)
+    def _append_debug_notes_text(self, text: str):
+        if self._debug_text is not None:
+            cursor = self._debug_text.textCursor()
+            cursor.movePosition(cursor.MoveOperation.End)
+            cursor.insertText(text)
 
     def _save_debug_notes(self):
         if not self._debug_notes_path or self._debug_text is None:
@@ -1802,6 +2407,25 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    def _dispatch_debug_notes_save(self):
+        """Snapshot the notes on the GUI thread, write them from the pool."""
+        if not self._debug_notes_path or self._debug_text is None:
+            return
+        path = str(self._debug_notes_path)
+        text = self._debug_text.toPlainText()
+
+        def _write():
+            try:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(text)
+            except Exception:
+                pass
+
+        QThreadPool.globalInstance().start(_write)
+
+    def _wait_for_background_saves(self):
+        QThreadPool.globalInstance().waitForDone(500)
+
     def _on_browse(self):
         """Open file dialog to select audio file."""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1815,43 +2439,42 @@ class MainWindow(QMainWindow):
             self._load_audio_file(file_path)
 
     def _is_supported_audio_file(self, file_path: str) -> bool:
-        ext = os.path.splitext(file_path)[1].lower()
-        return ext in {".wav", ".mp3", ".flac", ".ogg"}
+        return file_path.rpartition(".")[2].lower() in _SUPPORTED_AUDIO_EXTS
 
     def _set_drop_highlight(self, active: bool):
         if self._drop_highlight_active == active:
             return
         self._drop_highlight_active = active
-        if active:
-            accent = str(getattr(self, "_theme", {}).get("accent", "#33CED6"))
-            self.waveform_widget.setStyleSheet(f"border: 2px dashed {accent}; border-radius: 6px;")
-        else:
-            self.waveform_widget.setStyleSheet("")
+        qss = getattr(self, "_waveform_qss_drop", "") if active else ""
+        # setStyleSheet re-polishes the widget subtree even for an identical
+        # string, so only swap when the sheet actually changes.
+        if self.waveform_widget.styleSheet() != qss:
+            self.waveform_widget.setStyleSheet(qss)
 
     def dragEnterEvent(self, event):
+        accept = False
         md = event.mimeData()
         if md.hasUrls():
             urls = md.urls()
             if len(urls) == 1 and urls[0].isLocalFile():
-                path = urls[0].toLocalFile()
-                if self._is_supported_audio_file(path):
-                    event.acceptProposedAction()
-                    self._set_drop_highlight(True)
-                    return
-        event.ignore()
+                accept = self._is_supported_audio_file(urls[0].toLocalFile())
+        self._drag_accept = accept
+        if accept:
+            event.acceptProposedAction()
+            self._set_drop_highlight(True)
+        else:
+            event.ignore()
 
     def dragMoveEvent(self, event):
-        md = event.mimeData()
-        if md.hasUrls():
-            urls = md.urls()
-            if len(urls) == 1 and urls[0].isLocalFile():
-                path = urls[0].toLocalFile()
-                if self._is_supported_audio_file(path):
-                    event.acceptProposedAction()
-                    return
-        event.ignore()
+        # The payload cannot change mid-drag; reuse the enter decision
+        # instead of re-reading the URL list at mouse-move rate.
+        if self._drag_accept:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
 
     def dragLeaveEvent(self, event):
+        self._drag_accept = False
         self._set_drop_highlight(False)
         super().dragLeaveEvent(event)
 
@@ -1869,6 +2492,7 @@ class MainWindow(QMainWindow):
                         return
             event.ignore()
         finally:
+            self._drag_accept = False
             self._set_drop_highlight(False)
 
     def _load_audio_file(self, file_path: str, accurate_pitch: bool = False):
@@ -1887,6 +2511,7 @@ class MainWindow(QMainWindow):
 
             self._loading_file_path = str(file_path)
             self._load_dialog = None
+            self._last_load_stage = 0
 
             if self._show_loading_dialog:
                 dlg = QProgressDialog(tr("main.dialog.loading_label", "Loading audio..."), None, 0, 4, self)
@@ -1908,7 +2533,23 @@ class MainWindow(QMainWindow):
             self.waveform_toggle_btn.setEnabled(False)
             self.play_btn.setEnabled(False)
 
-            self._load_thread = LoadAudioThread(str(file_path), fast_pitch=not bool(accurate_pitch))
+            cached_pitch = None
+            if not accurate_pitch:
+                try:
+                    cache_key = (str(file_path), os.path.getmtime(file_path))
+                    cached_pitch = self._pitch_cache.get(cache_key)
+                    if cached_pitch is not None:
+                        # Refresh recency so repeated loads keep hot entries alive.
+                        self._pitch_cache.pop(cache_key, None)
+                        self._pitch_cache[cache_key] = cached_pitch
+                except OSError:
+                    cached_pitch = None
+
+            self._load_thread = LoadAudioThread(
+                str(file_path),
+                fast_pitch=not bool(accurate_pitch),
+                cached_pitch=cached_pitch,
+            )
             self._load_thread.progress.connect(self._on_load_progress)
             self._load_thread.finished.connect(self._on_load_finished)
             self._load_thread.error.connect(self._on_load_error)
@@ -1922,17 +2563,14 @@ class MainWindow(QMainWindow):
                 pass
             QMessageBox.critical(self, "Error", f"Failed to load audio file:\n{str(e)}")
 
-    def _on_load_progress(self, msg: str):
+    def _on_load_progress(self, stage: int, msg: str):
         if self._load_dialog is not None:
             try:
                 self._load_dialog.setLabelText(str(msg))
-                m = str(msg).lower()
-                if "reading" in m:
-                    self._load_dialog.setValue(1)
-                elif "detecting" in m:
-                    self._load_dialog.setValue(2)
-                elif "final" in m:
-                    self._load_dialog.setValue(3)
+                # setValue repaints the dialog; only push a stage once.
+                if int(stage) != self._last_load_stage:
+                    self._last_load_stage = int(stage)
+                    self._load_dialog.setValue(int(stage))
             except Exception:
                 pass
 
@@ -1953,6 +2591,8 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
+        self._pcm_cache.clear()
+        self._last_waveform_key = None
         self.original_audio = np.asarray(audio, dtype=np.float32)
         self.sample_rate = int(sr)
         self.original_sample_rate = int(original_sr)
@@ -1972,6 +2612,16 @@ class MainWindow(QMainWindow):
 
         self.settings_panel.set_detected_pitch(note, freq, cents)
 
+        if self.current_file_path and note is not None:
+            try:
+                cache_key = (self.current_file_path, os.path.getmtime(self.current_file_path))
+                self._pitch_cache.pop(cache_key, None)
+                self._pitch_cache[cache_key] = (freq, note, cents)
+                while len(self._pitch_cache) > self._pitch_cache_max:
+                    self._pitch_cache.pop(next(iter(self._pitch_cache)))
+            except OSError:
+                pass
+
         if note is not None:
             self._set_target_midi(note_name_to_midi(note), schedule_processing=False, immediate=False)
 
@@ -2009,11 +2659,22 @@ class MainWindow(QMainWindow):
 
         if immediate:
             self._processing_debounce_timer.start(0)
-        else:
-            self._processing_debounce_timer.start()
+            return
+
+        now = time.monotonic()
+        if self._debounce_first_scheduled_ts is None:
+            self._debounce_first_scheduled_ts = now
+        elif (now - self._debounce_first_scheduled_ts) > self._debounce_max_latency_s:
+            # The burst has already deferred one full max-latency window;
+            # fire now so a continuous drag still shows intermediate results.
+            self._processing_debounce_timer.start(0)
+            return
+
+        self._processing_debounce_timer.start()
 
     def _on_process(self):
         """Process the audio with current settings."""
+        self._debounce_first_scheduled_ts = None
         if self.original_audio is None:
             return
 
@@ -2025,8 +2686,14 @@ class MainWindow(QMainWindow):
             return
 
         if hasattr(self, "processing_thread") and self.processing_thread is not None and self.processing_thread.isRunning():
+            if self._processing_pending and self._pending_settings == settings:
+                # Identical follow-up already queued; nothing new to run.
+                return
             self._processing_pending = True
             self._pending_settings = settings
+            # The running job's output is already stale; let it bail out at the
+            # next stage boundary instead of finishing passes we will discard.
+            self.processing_thread.requestInterruption()
             return
 
         self._stop_preview_playback()
@@ -2041,6 +2708,7 @@ class MainWindow(QMainWindow):
         self.processing_thread.finished.connect(lambda result, _t=token: self._on_processing_finished(result, _t))
         self.processing_thread.error.connect(lambda msg, _t=token: self._on_processing_error(msg, _t))
         self.processing_thread.progress.connect(lambda msg, _t=token: self._on_processing_progress(msg, _t))
+        self.processing_thread.interrupted.connect(lambda _t=token: self._on_processing_interrupted(_t))
 
         self.processing_thread.start()
 
@@ -2077,6 +2745,8 @@ class MainWindow(QMainWindow):
             return
 
         self._hide_processing_label()
+        self._pcm_cache.clear()
+        self._last_waveform_key = None
         self.processed_audio = self._pending_processed_result
         self._pending_processed_result = None
 
@@ -2090,6 +2760,25 @@ class MainWindow(QMainWindow):
         self.waveform_toggle_btn.setEnabled(True)
         self._update_play_button_enabled()
 
+    def _on_processing_interrupted(self, token: int):
+        """A processing run bailed out early because newer settings arrived."""
+        if token != self._current_processing_token:
+            return
+
+        thread = getattr(self, "processing_thread", None)
+        if thread is not None:
+            # The signal arrives from just before run() returns; give the
+            # thread a moment to actually exit so the restart isn't re-queued.
+            thread.wait(100)
+
+        if self._processing_pending and self._pending_settings is not None:
+            pending = self._pending_settings
+            self._processing_pending = False
+            self._pending_settings = None
+            self._start_processing_with_settings(pending)
+        else:
+            self._hide_processing_label()
+
     def _on_processing_error(self, error_msg: str, token: int):
         """Handle processing error."""
         if token != self._current_processing_token:
@@ -2144,13 +2833,24 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Export Error", f"Failed to export:\n{str(e)}")
 
     def _make_unique_export_path(self, path: str) -> str:
+        # O_CREAT|O_EXCL both tests and reserves the name in one syscall, so
+        # there is no exists()-then-write window for another process to win.
+        # save_audio reopens the reserved (empty) file by name and overwrites.
         base, ext = os.path.splitext(str(path))
         candidate = str(path)
         i = 1
-        while os.path.exists(candidate):
-            candidate = f"{base} ({i}){ext}"
-            i += 1
-        return candidate
+        while True:
+            try:
+                fd = os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                candidate = f"{base} ({i}){ext}"
+                i += 1
+                continue
+            except OSError:
+                # Unwritable target directory etc.; let save_audio surface it.
+                return candidate
+            os.close(fd)
+            return candidate
 
     def _on_quick_export(self):
         if self.processed_audio is None:
@@ -2203,13 +2903,29 @@ class MainWindow(QMainWindow):
 
     def _sync_piano_roll_to_settings(self):
         target = self.settings_panel.get_target_note()
-        self.piano_roll.set_selected_note(target)
-        self.piano_roll.set_display_octave(self.settings_panel.octave_spin.value())
+        octave = int(self.settings_panel.octave_spin.value())
 
-        try:
-            self.waveform_widget.set_blob_midi_note(note_name_to_midi(target), emit_signal=False)
-        except Exception:
-            pass
+        if (target, octave) != self._last_sync:
+            self._last_sync = (target, octave)
+
+            # Parse the note name once and hand the MIDI number to both
+            # widgets instead of letting each re-parse the string.
+            try:
+                midi = note_name_to_midi(target)
+            except Exception:
+                midi = None
+
+            if midi is not None:
+                self.piano_roll.set_selected_note_midi(midi)
+            else:
+                self.piano_roll.set_selected_note(target)
+            self.piano_roll.set_display_octave(octave)
+
+            if midi is not None:
+                try:
+                    self.waveform_widget.set_blob_midi_note(midi, emit_signal=False)
+                except Exception:
+                    pass
 
         try:
             y_min, y_max = self.waveform_widget.get_midi_view_range()
@@ -2240,8 +2956,7 @@ class MainWindow(QMainWindow):
         target = "original" if current == "processed" else "processed"
 
         anim = getattr(self, "_waveform_fade_anim", None)
-        fx = getattr(self, "_waveform_opacity_effect", None)
-        if anim is None or fx is None:
+        if anim is None:
             self._waveform_view = target
             self._update_waveform_display()
             self._update_play_button_enabled()
@@ -2254,16 +2969,16 @@ class MainWindow(QMainWindow):
             pass
 
         try:
-            start = float(fx.opacity())
+            start = int(self.waveform_widget.waveform_alpha)
         except Exception:
-            start = 1.0
+            start = 255
 
         try:
             self._waveform_fade_target_view = target
             self._waveform_fade_phase = "out"
             anim.setDuration(140)
             anim.setStartValue(start)
-            anim.setEndValue(0.0)
+            anim.setEndValue(0)
             anim.start()
         except Exception:
             self._waveform_view = target
@@ -2271,19 +2986,29 @@ class MainWindow(QMainWindow):
             self._update_play_button_enabled()
 
     def _update_waveform_display(self):
-        if self._waveform_view == "processed" and self.processed_audio is not None:
+        showing_processed = self._waveform_view == "processed" and self.processed_audio is not None
+        arr = self.processed_audio if showing_processed else self.original_audio
+
+        if showing_processed:
             self.waveform_label.setText(tr("main.waveform.processed", "Processed"))
-            self.waveform_widget.set_audio(self.processed_audio, self.sample_rate)
             self.waveform_toggle_btn.setText(tr("main.button.show_original", "Show Original"))
         else:
             self.waveform_label.setText(tr("main.waveform.original", "Original"))
-            if self.original_audio is not None:
-                self.waveform_widget.set_audio(self.original_audio, self.sample_rate)
-            else:
-                self.waveform_widget.clear()
             self.waveform_toggle_btn.setText(tr("main.button.show_processed", "Show Processed"))
             self.waveform_toggle_btn.setEnabled(self.processed_audio is not None)
 
+        # The labels above are cheap; re-uploading an unchanged array to the
+        # waveform widget is not, so short-circuit on the same (view, array).
+        key = (self._waveform_view, id(arr) if arr is not None else None, int(self.sample_rate))
+        if key == self._last_waveform_key:
+            return
+        self._last_waveform_key = key
+
+        if arr is not None:
+            self.waveform_widget.set_audio(arr, self.sample_rate)
+        else:
+            self.waveform_widget.clear()
+
     def _current_preview_audio(self):
         if self._waveform_view == "processed" and self.processed_audio is not None:
             return self.processed_audio
@@ -2293,17 +3018,14 @@ class MainWindow(QMainWindow):
         self.play_btn.setEnabled(self._current_preview_audio() is not None)
 
     def _is_preview_playing(self) -> bool:
-        if self._audio_sink is None:
-            return False
-        try:
-            return self._audio_sink.state() == QAudio.State.ActiveState
-        except Exception:
+        state_fn = self._sink_state
+        if state_fn is None:
             return False
+        return int(state_fn()) == self._STATE_ACTIVE
 
     def _stop_preview_playback(self):
         try:
-            if self._volume_ramp_timer.isActive():
-                self._volume_ramp_timer.stop()
+            self._volume_ramp_anim.stop()
         except Exception:
             pass
         self._volume_ramp_on_done = None
@@ -2326,8 +3048,11 @@ class MainWindow(QMainWindow):
         if self._preview_cleanup_scheduled:
             return
         self._preview_cleanup_scheduled = True
-        QTimer.singleShot(0, self._finalize_preview_cleanup)
+        # Small delay so a burst of Idle/Stopped transitions (end-of-stream
+        # followed by auto-stop) collapses into a single teardown pass.
+        QTimer.singleShot(20, self._finalize_preview_cleanup)
 
+    @pyqtSlot()
     def _finalize_preview_cleanup(self):
         self._preview_cleanup_scheduled = False
 
@@ -2335,27 +3060,54 @@ class MainWindow(QMainWindow):
         if sink is None:
             return
 
+        if self._sink_state is not None and int(self._sink_state()) == self._STATE_ACTIVE:
+            self._schedule_preview_cleanup()
+            return
+
         try:
-            if sink.state() == QAudio.State.ActiveState:
-                self._schedule_preview_cleanup()
-                return
+            sink.stop()
         except Exception:
             pass
 
+        # Keep the sink and buffer alive for the next press — constructing a
+        # QAudioSink renegotiates the device — and release only the PCM data.
         try:
-            sink.stateChanged.disconnect(self._on_preview_state_changed)
+            if self._audio_buffer is not None:
+                self._audio_buffer.close()
         except Exception:
             pass
+        self._audio_bytes = None
+        self._last_written_volume = None
 
         try:
-            sink.stop()
+            self.play_btn.setText("Play")
         except Exception:
             pass
 
+    def _destroy_preview_sink(self):
+        """Full teardown; only needed on sample-rate change or window close."""
+        sink = self._audio_sink
         buf = self._audio_buffer
         self._audio_sink = None
         self._audio_buffer = None
         self._audio_bytes = None
+        self._sink_state = None
+        self._audio_sink_sr = None
+        self._last_written_volume = None
+
+        if sink is not None:
+            try:
+                sink.stateChanged.disconnect(self._on_preview_state_changed)
+            except Exception:
+                pass
+            try:
+                sink.stop()
+            except Exception:
+                pass
+            try:
+                sink.deleteLater()
+            except Exception:
+                pass
 
         try:
             if buf is not None:
@@ -2364,40 +3116,102 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        try:
-            sink.deleteLater()
-        except Exception:
-            pass
-
-        try:
-            self.play_btn.setText("Play")
-        except Exception:
-            pass
-
-    def _build_preview_pcm_bytes(self, audio: np.ndarray, sr: int) -> bytes:
+    def _build_preview_pcm(self, audio: np.ndarray, sr: int) -> np.ndarray:
         audio_arr = np.asarray(audio, dtype=np.float32)
         if audio_arr.ndim != 1:
             audio_arr = np.asarray(audio_arr.reshape(-1), dtype=np.float32)
 
         n = int(audio_arr.shape[0])
         if n <= 0:
-            return b""
+            return np.empty(0, dtype=np.int16)
 
         pre_ms = 0
         pre_n = max(0, int(int(sr) * (float(pre_ms) / 1000.0)))
-        if pre_n > 0:
-            audio_arr = np.concatenate([np.zeros(pre_n, dtype=np.float32), audio_arr], axis=0)
 
         fade_ms = 3
-        fade_n = max(0, min(int(audio_arr.shape[0]), int(int(sr) * (float(fade_ms) / 1000.0))))
-        if fade_n > 1:
-            ramp = np.linspace(0.0, 1.0, fade_n, dtype=np.float32)
-            audio_arr = audio_arr.copy()
-            audio_arr[:fade_n] *= ramp
+        fade_n = max(0, min(n, int(int(sr) * (float(fade_ms) / 1000.0))))
+        if fade_n <= 1:
+            fade_n = 0
+
+        # Write straight into a preallocated int16 buffer: one float scratch
+        # for the scaled bulk instead of the old copy + product + cast chain,
+        # and any lead-in silence is zeroed in place of the concatenate.
+        out = np.empty(pre_n + n, dtype=np.int16)
+        if pre_n > 0:
+            out[:pre_n] = 0
+
+        scratch = np.multiply(audio_arr[fade_n:], np.float32(32767.0))
+        np.clip(scratch, -32768.0, 32767.0, out=scratch)
+        np.rint(scratch, out=scratch)
+        # Assignment casts float32 -> int16 while copying into the output,
+        # so no intermediate int16 array is materialized.
+        out[pre_n + fade_n :] = scratch
+
+        if fade_n > 0:
+            # The fade head is only a few ms of samples; its temporaries are
+            # negligible next to the bulk path above.
+            head = np.multiply(audio_arr[:fade_n], _fade_ramp(fade_n))
+            head *= np.float32(32767.0)
+            np.clip(head, -32768.0, 32767.0, out=head)
+            np.rint(head, out=head)
+            out[pre_n : pre_n + fade_n] = head
+
+        return out
+
+    def _begin_pcm_encode(self, audio: np.ndarray, sr: int, key: tuple):
+        """Encode the preview PCM on the pool, then resume playback on the GUI thread.
+
+        Keyed by array identity: both load and processing completion clear the
+        cache before their arrays can be released, so a recycled id cannot
+        alias a stale entry.
+        """
+        if self._pcm_encoding:
+            return
+        self._pcm_encoding = True
+        try:
+            self.play_btn.setEnabled(False)
+        except Exception:
+            pass
 
-        audio_arr = np.clip(audio_arr, -1.0, 1.0)
-        pcm = (audio_arr * 32767.0).astype(np.int16, copy=False)
-        return pcm.tobytes(order="C")
+        def _encode():
+            try:
+                pcm = self._build_preview_pcm(audio, int(sr))
+                # Construct straight from the int16 array's buffer: one copy
+                # into Qt-owned storage, no intermediate Python bytes object.
+                ba = QByteArray(memoryview(pcm)) if pcm.size else QByteArray()
+            except Exception:
+                ba = QByteArray()
+            self._pcm_async_key = key
+            self._pcm_async_result = ba
+            QMetaObject.invokeMethod(self, "_on_pcm_ready", Qt.ConnectionType.QueuedConnection)
+
+        QThreadPool.globalInstance().start(_encode)
+
+    @pyqtSlot()
+    def _on_pcm_ready(self):
+        self._pcm_encoding = False
+        key = self._pcm_async_key
+        ba = self._pcm_async_result
+        self._pcm_async_key = None
+        self._pcm_async_result = None
+        self._update_play_button_enabled()
+
+        if key is None or ba is None or ba.isEmpty():
+            return
+
+        audio = self._current_preview_audio()
+        if audio is None:
+            return
+        cur_key = (id(audio), int(self.sample_rate), int(audio.shape[0]))
+        if cur_key != key:
+            # The audio changed while encoding; the bytes are stale, and
+            # caching them under a possibly recycled id would be unsafe.
+            return
+
+        while len(self._pcm_cache) >= 2:
+            self._pcm_cache.pop(next(iter(self._pcm_cache)))
+        self._pcm_cache[key] = ba
+        self._start_preview_playback()
 
     def _start_preview_playback(self):
         self._stop_preview_playback()
@@ -2406,28 +3220,59 @@ class MainWindow(QMainWindow):
         if audio is None:
             return
 
-        pcm_bytes = self._build_preview_pcm_bytes(audio, int(self.sample_rate))
-        if not pcm_bytes:
+        key = (id(audio), int(self.sample_rate), int(audio.shape[0]))
+        pcm_data = self._pcm_cache.get(key)
+        if pcm_data is None:
+            # First play of this array: keep the GUI thread responsive and
+            # come back through _on_pcm_ready once the bytes exist.
+            self._begin_pcm_encode(audio, int(self.sample_rate), key)
+            return
+        if pcm_data.isEmpty():
             return
 
-        fmt = QAudioFormat()
-        fmt.setSampleRate(int(self.sample_rate))
-        fmt.setChannelCount(1)
-        fmt.setSampleFormat(QAudioFormat.SampleFormat.Int16)
+        sr = int(self.sample_rate)
+        if self._audio_sink is not None and self._audio_sink_sr != sr:
+            # Format changed; the cached sink cannot be retuned in place.
+            self._destroy_preview_sink()
 
-        device = QMediaDevices.defaultAudioOutput()
-        self._audio_sink = QAudioSink(device, fmt, self)
-        self._audio_sink.stateChanged.connect(self._on_preview_state_changed)
-        try:
-            self._audio_sink.setBufferSize(int(self.sample_rate) * 2 * 2)
-        except Exception:
-            pass
-        self._audio_sink.setVolume(float(max(0.0, min(1.0, self._preview_volume))))
+        if self._audio_sink is None:
+            fmt = QAudioFormat()
+            fmt.setSampleRate(sr)
+            fmt.setChannelCount(1)
+            fmt.setSampleFormat(QAudioFormat.SampleFormat.Int16)
+
+            device = QMediaDevices.defaultAudioOutput()
+            self._audio_sink = QAudioSink(device, fmt, self)
+            self._audio_sink_sr = sr
+            self._sink_state = self._audio_sink.state
+            # Queued: the backend may emit from its own thread, and queuing lets
+            # the event loop coalesce rapid transitions before the UI reacts.
+            self._audio_sink.stateChanged.connect(
+                self._on_preview_state_changed, Qt.ConnectionType.QueuedConnection
+            )
+            try:
+                self._audio_sink.setBufferSize(sr * 2 * int(self._preview_buffer_ms) // 1000)
+            except Exception:
+                pass
+
+        start_volume = _clamp01(float(self._preview_volume))
+        self._audio_sink.setVolume(start_volume)
+        self._last_written_volume = start_volume
 
-        self._audio_bytes = QByteArray(pcm_bytes)
-        self._audio_buffer = QBuffer(self)
+        self._audio_bytes = pcm_data
+        if self._audio_buffer is None:
+            self._audio_buffer = QBuffer(self)
+        else:
+            try:
+                self._audio_buffer.close()
+            except Exception:
+                pass
         self._audio_buffer.setData(self._audio_bytes)
-        self._audio_buffer.open(QIODeviceBase.OpenModeFlag.ReadOnly)
+        # Unbuffered: the QBuffer is already in memory, so QIODevice's own
+        # read buffer would only add a copy between it and the sink.
+        self._audio_buffer.open(
+            QIODeviceBase.OpenModeFlag.ReadOnly | QIODeviceBase.OpenModeFlag.Unbuffered
+        )
 
         self._audio_sink.start(self._audio_buffer)
 
@@ -2443,84 +3288,67 @@ class MainWindow(QMainWindow):
 
     def _ramp_volume(self, target: float, duration_ms: int = 40, on_done=None):
         """Small preview-only fade to prevent clicks/pops on some audio devices."""
-        t = float(max(0.0, min(1.0, target)))
-        if self._volume_ramp_timer.isActive():
-            self._volume_ramp_timer.stop()
+        t = _clamp01(float(target))
 
-        self._volume_ramp_on_done = on_done
-        self._volume_ramp_target = t
-
-        try:
-            if self._audio_sink is not None:
-                cur = float(self._audio_sink.volume())
-            else:
-                cur = float(self._preview_volume)
-        except Exception:
+        if self._audio_sink is not None and self._last_written_volume is not None:
+            cur = self._last_written_volume
+        else:
             cur = float(self._preview_volume)
 
-        interval = int(self._volume_ramp_timer.interval())
-        steps = max(1, int(max(0, int(duration_ms)) / max(1, interval)))
-        self._volume_ramp_steps_left = steps
-        self._volume_ramp_step = (t - cur) / float(steps)
-
-        self._volume_ramp_timer.start()
-
-    def _on_volume_ramp_tick(self):
-        if self._volume_ramp_steps_left <= 0:
-            self._volume_ramp_timer.stop()
-            if callable(self._volume_ramp_on_done):
-                fn = self._volume_ramp_on_done
-                self._volume_ramp_on_done = None
-                fn()
-            return
-
-        self._volume_ramp_steps_left -= 1
-        try:
-            if self._audio_sink is not None:
-                cur = float(self._audio_sink.volume())
-            else:
-                cur = 0.0
-        except Exception:
-            cur = 0.0
-
-        new_v = cur + float(self._volume_ramp_step)
-        if (self._volume_ramp_step >= 0 and new_v > self._volume_ramp_target) or (
-            self._volume_ramp_step < 0 and new_v < self._volume_ramp_target
-        ):
-            new_v = float(self._volume_ramp_target)
+        # Retargeting a running fade restarts the animation from the current
+        # backend value, so there is no step toward a stale target.
+        anim = self._volume_ramp_anim
+        anim.stop()
+        self._volume_ramp_on_done = on_done
+        anim.setDuration(max(0, int(duration_ms)))
+        anim.setStartValue(cur)
+        anim.setEndValue(t)
+        anim.start()
 
-        try:
-            if self._audio_sink is not None:
-                self._audio_sink.setVolume(float(max(0.0, min(1.0, new_v))))
-        except Exception:
-            pass
+    def _on_volume_ramp_finished(self):
+        if callable(self._volume_ramp_on_done):
+            fn = self._volume_ramp_on_done
+            self._volume_ramp_on_done = None
+            fn()
 
     def _on_preview_state_changed(self, state):
-        try:
-            if state == QAudio.State.ActiveState:
-                self.play_btn.setText("Stop")
-            else:
-                self.play_btn.setText("Play")
-        except Exception:
-            pass
-
-        try:
-            if state in (QAudio.State.IdleState, QAudio.State.StoppedState):
-                self._schedule_preview_cleanup()
-        except Exception:
-            pass
+        s = int(state)
+        if self.play_btn is not None:
+            self.play_btn.setText("Stop" if s == self._STATE_ACTIVE else "Play")
+
+        if s == self._STATE_IDLE or s == self._STATE_STOPPED:
+            if s == self._STATE_IDLE:
+                # Idle with unread data left means the sink starved rather
+                # than reached end-of-stream: give it a bigger buffer next
+                # time. Dropping the cached rate forces the sink rebuild.
+                try:
+                    buf = self._audio_buffer
+                    if buf is not None and buf.isOpen() and not buf.atEnd():
+                        if self._preview_buffer_ms < 500:
+                            self._preview_buffer_ms = min(500, self._preview_buffer_ms + 50)
+                            self._audio_sink_sr = None
+                except Exception:
+                    pass
+            self._schedule_preview_cleanup()
 
     def closeEvent(self, event):
+        # Qt can deliver a second close event while teardown is in flight;
+        # only the first one does any work.
+        if self._closed:
+            super().closeEvent(event)
+            return
+        self._closed = True
+
+        # The callees are internally safe for ordinary errors; the finally
+        # chain covers BaseExceptions (KeyboardInterrupt/SystemExit) so the
+        # volume fade is stopped and the window really closes either way.
         try:
-            self._stop_preview_playback()
-        except Exception:
-            pass
-        try:
-            self._save_persistent_settings()
-        except Exception:
-            pass
-        try:
-            self._save_debug_notes()
-        except Exception:
-            pass
-        super().closeEvent(event)
+            try:
+                self._stop_preview_playback()
+                self._destroy_preview_sink()
+                self._save_persistent_settings()
+            finally:
+                self._dispatch_debug_notes_save()
+        finally:
+            self._volume_ramp_anim.stop()
+            super().closeEvent(event)
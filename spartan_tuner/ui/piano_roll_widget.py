@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtGui import QPainter, QColor, QFont, QPen
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPainter, QColor, QFont, QPen, QImage
+from PyQt6.QtCore import Qt, QRect
 
 from utils.note_utils import note_name_to_midi
 
@@ -37,16 +37,46 @@ class PianoRollWidget(QWidget):
             "text": "#ffffff",
         }
 
+        # Per-pitch-class paint metadata and the themed QColor/QPen/QFont
+        # set are built once here (and on theme change) instead of per row
+        # in paintEvent.
+        self._note_meta = tuple(
+            (n, n in self.black_notes, self.black_key_width if n in self.black_notes else self.white_key_width)
+            for n in self.note_names
+        )
+        self._font = QFont("Arial", 8)
+        # Offscreen raster of the unselected key grid; only the selected row
+        # is painted live on top of it.
+        self._bg_cache = None
+        self._bg_cache_key = None
+        self._rebuild_paint_cache()
+
         self.setMinimumWidth(50)
         self.setMinimumHeight(200)
 
     def apply_theme(self, theme: dict):
         if isinstance(theme, dict):
             self._theme.update({k: str(v) for k, v in theme.items() if v is not None})
+        self._rebuild_paint_cache()
         self.update()
 
+    def _rebuild_paint_cache(self):
+        t = self._theme
+        accent = QColor(str(t.get("accent", "#33CED6")))
+        self._color_black = QColor(str(t.get("bg", "#2E2E2E")))
+        self._color_white = QColor(str(t.get("panel", "#404040")))
+        self._color_sel_black = QColor(str(t.get("primary", "#1D5AAA")))
+        self._color_sel_white = accent
+        self._text_sel = QColor(str(t.get("text", "#ffffff")))
+        self._text_norm = QColor(accent.red(), accent.green(), accent.blue(), 220)
+        self._border_pen = QPen(QColor(str(t.get("primary", "#1D5AAA"))), 1)
+        self._bg_cache_key = None
+
     def set_selected_note(self, note_name: str):
         """Set the currently selected/highlighted note. E.g., 'C4', 'F#3'."""
+        if note_name == self.selected_note:
+            return
+
         self.selected_note = note_name
         if note_name and note_name[-1].isdigit():
             try:
@@ -55,9 +85,24 @@ class PianoRollWidget(QWidget):
                 pass
 
         try:
-            self._selected_midi = int(note_name_to_midi(note_name))
+            midi = int(note_name_to_midi(note_name))
         except Exception:
-            self._selected_midi = None
+            midi = None
+        if midi == self._selected_midi:
+            # Same highlight (e.g. an enharmonic respelling); nothing to repaint.
+            return
+        self._selected_midi = midi
+        self.update()
+
+    def set_selected_note_midi(self, midi: int):
+        """Set the highlighted note from a MIDI number, skipping the name parse."""
+        m = int(midi)
+        if m == self._selected_midi:
+            return
+        self._selected_midi = m
+        octave = (m // 12) - 1
+        self.selected_note = f"{self.note_names[m % 12]}{octave}"
+        self.selected_octave = octave
         self.update()
 
     def set_midi_range(self, midi_min: float, midi_max: float):
@@ -79,13 +124,13 @@ class PianoRollWidget(QWidget):
 
     def set_display_octave(self, octave: int):
         """Set which octave to display (2-7)."""
-        self.display_octave = max(2, min(7, int(octave)))
+        clamped = max(2, min(7, int(octave)))
+        if clamped == self.display_octave:
+            return
+        self.display_octave = clamped
         self.update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
+    def _row_geometry(self):
         height = self.height()
 
         midi_min, midi_max = self._midi_range
@@ -98,42 +143,89 @@ class PianoRollWidget(QWidget):
         row_h = max(6, int(height / count))
         total_h = row_h * count
         y0 = max(0, int((height - total_h) / 2))
+        return midi_top, midi_bottom, row_h, y0
+
+    def _ensure_bg_cache(self, midi_top, midi_bottom, row_h, y0):
+        dpr = float(self.devicePixelRatioF())
+        key = (self.width(), self.height(), self._midi_range, dpr)
+        if key == self._bg_cache_key and self._bg_cache is not None:
+            return
+
+        img = QImage(
+            max(1, int(self.width() * dpr)),
+            max(1, int(self.height() * dpr)),
+            QImage.Format.Format_ARGB32_Premultiplied,
+        )
+        img.setDevicePixelRatio(dpr)
+        img.fill(0)
+
+        p = QPainter(img)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Bucket the rows by fill color so each color costs one drawRects
+        # call instead of a brush/pen switch per row.
+        black_rects = []
+        white_rects = []
+        borders = []
+        labels = []
 
         y = y0
+        x = 0
         for midi in range(midi_top, midi_bottom - 1, -1):
-            note_name = self.note_names[midi % 12]
-            is_black = note_name in self.black_notes
-            is_selected = (self._selected_midi is not None) and (int(self._selected_midi) == int(midi))
+            note_name, is_black, key_width = self._note_meta[midi % 12]
+            rect = QRect(x, y, key_width, row_h - 1)
+            (black_rects if is_black else white_rects).append(rect)
+            borders.append(rect)
+            if row_h >= 10:
+                labels.append((x + 4, y + row_h - 3, note_name))
+            y += row_h
 
-            t = self._theme
-            bg = str(t.get("bg", "#2E2E2E"))
-            panel = str(t.get("panel", "#404040"))
-            primary = str(t.get("primary", "#1D5AAA"))
-            accent = str(t.get("accent", "#33CED6"))
-            text = str(t.get("text", "#ffffff"))
+        p.setPen(Qt.PenStyle.NoPen)
+        for color, rects in ((self._color_black, black_rects), (self._color_white, white_rects)):
+            if rects:
+                p.setBrush(color)
+                p.drawRects(rects)
 
-            if is_selected:
-                color = QColor(primary) if is_black else QColor(accent)
-            else:
-                color = QColor(bg) if is_black else QColor(panel)
+        p.setBrush(Qt.BrushStyle.NoBrush)
+        p.setPen(self._border_pen)
+        p.drawRects(borders)
 
-            key_width = self.black_key_width if is_black else self.white_key_width
-            x = 0 if not is_black else 0
-            painter.fillRect(x, y, key_width, row_h - 1, color)
+        if labels:
+            p.setFont(self._font)
+            p.setPen(self._text_norm)
+            for lx, ly, name in labels:
+                p.drawText(lx, ly, name)
 
-            painter.setPen(QPen(QColor(primary), 1))
-            painter.drawRect(x, y, key_width, row_h - 1)
+        p.end()
+        self._bg_cache = img
+        self._bg_cache_key = key
 
-            if row_h >= 10:
-                if is_selected:
-                    painter.setPen(QColor(text))
-                else:
-                    c = QColor(accent)
-                    painter.setPen(QColor(c.red(), c.green(), c.blue(), 220))
-                font = QFont("Arial", 8)
-                painter.setFont(font)
-                painter.drawText(x + 4, y + row_h - 3, note_name)
+    def paintEvent(self, event):
+        # The unselected grid is invariant across selection changes, so it is
+        # rasterized once per (size, range, theme) and blitted; only the
+        # selected row is painted live on top.
+        midi_top, midi_bottom, row_h, y0 = self._row_geometry()
+        self._ensure_bg_cache(midi_top, midi_bottom, row_h, y0)
 
-            y += row_h
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawImage(0, 0, self._bg_cache)
+
+        sel = self._selected_midi
+        if sel is not None and midi_bottom <= sel <= midi_top:
+            note_name, is_black, key_width = self._note_meta[sel % 12]
+            y = y0 + (midi_top - sel) * row_h
+
+            color = self._color_sel_black if is_black else self._color_sel_white
+            painter.fillRect(0, y, key_width, row_h - 1, color)
+
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.setPen(self._border_pen)
+            painter.drawRect(0, y, key_width, row_h - 1)
+
+            if row_h >= 10:
+                painter.setFont(self._font)
+                painter.setPen(self._text_sel)
+                painter.drawText(4, y + row_h - 3, note_name)
 
         painter.end()
@@ -1,21 +1,109 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
     QCheckBox, QSlider, QGroupBox, QPushButton, QSpinBox, QDoubleSpinBox,
-    QMessageBox, QStyledItemDelegate, QStyle, QSizePolicy, QTabWidget
+    QStyledItemDelegate, QStyle, QSizePolicy, QTabWidget,
+    QListView
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QSize, QTimer
 from PyQt6.QtGui import QColor, QFont, QFontMetrics, QStandardItem, QStandardItemModel
 
 import importlib
+from contextlib import contextmanager
+from functools import lru_cache
 
 from utils.i18n import tr
 
+_NOTE_IDX = {n: i for i, n in enumerate(["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"])}
+# Frozen MIDI->Hz table; the pow() per note/octave change is paid once at import.
+_MIDI_HZ = tuple(440.0 * (2 ** ((m - 69) / 12)) for m in range(128))
+
+# Static combo item definitions: (label tr key, label default, info tr key,
+# info default, method key). tr() is still applied at populate time so the
+# active translation is honored.
+_STRETCH_METHOD_DEFS = (
+    (
+        "settings.stretch_method.audiotsm_wsola.label",
+        "WSOLA Speech",
+        "settings.stretch_method.audiotsm_wsola.info",
+        "Crisp in quality and the best for general speech audio. Can sound robotic if over-done.",
+        "audiotsm_wsola",
+    ),
+    (
+        "settings.stretch_method.audiotsm_phasevocoder.label",
+        "Phasevocoder",
+        "settings.stretch_method.audiotsm_phasevocoder.info",
+        "Smoother and more ideal under x2 stretching",
+        "audiotsm_phasevocoder",
+    ),
+    (
+        "settings.stretch_method.rubberband_default_engine_finer.label",
+        "Rubberband Default",
+        "settings.stretch_method.rubberband_default_engine_finer.info",
+        "Baseline of any stretching method.",
+        "rubberband_default_engine_finer",
+    ),
+    (
+        "settings.stretch_method.rubberband_percussive_engine_finer.label",
+        "Rubberband Percussive",
+        "settings.stretch_method.rubberband_percussive_engine_finer.info",
+        "Deals with transients and artifact removal a lot better than Rubberband Default.",
+        "rubberband_percussive_engine_finer",
+    ),
+    (
+        "settings.stretch_method.tdpsola.label",
+        "TD-PSOLA",
+        "settings.stretch_method.tdpsola.info",
+        "Fallback stretcher that works without audiotsm/rubberband (can be slower).",
+        "tdpsola",
+    ),
+)
+
+_PITCH_MODE_DEFS = (
+    (
+        "settings.pitch_mode.praat_soft.label",
+        "PSOLA (Praat) Soft",
+        "settings.pitch_mode.praat_soft.info",
+        "Natural + smooth retune using Praat overlap-add. Requires praat-parselmouth.",
+        "praat_soft",
+    ),
+    (
+        "settings.pitch_mode.world_soft.label",
+        "WORLD Soft (Retune)",
+        "settings.pitch_mode.world_soft.info",
+        "Smooth retune with amount/speed/vibrato controls (WORLD vocoder).",
+        "world_soft",
+    ),
+    (
+        "settings.pitch_mode.world_hard.label",
+        "WORLD Hard (Flatten)",
+        "settings.pitch_mode.world_hard.info",
+        "Hard snap to the target note for the most robotic/locked sound (WORLD vocoder).",
+        "world_hard",
+    ),
+)
+
+
+@lru_cache(maxsize=8)
+def _max_text_advance(font_family: str, point_size: int, texts: tuple) -> int:
+    """Widest horizontalAdvance over texts, memoized per font + text set."""
+    fm = QFontMetrics(QFont(font_family, int(point_size)))
+    return max(fm.horizontalAdvance(str(t)) for t in texts)
+
 
 class StretchMethodDelegate(QStyledItemDelegate):
+    _ALIGN_TL = int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+    _ALIGN_BL = int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._theme_selected_bg = QColor("#6B999F")
         self._theme_info_fg = QColor(51, 206, 214, 170)
+        # Fonts derived from option.font, rebuilt only when the base font
+        # changes rather than twice per row per repaint.
+        self._font_key = None
+        self._label_font = None
+        self._info_font = None
+        self._size_hint = None
 
     def set_theme(self, theme: dict):
         try:
@@ -39,34 +127,48 @@ class StretchMethodDelegate(QStyledItemDelegate):
 
         rect = option.rect.adjusted(10, 6, -10, -6)
 
-        label_font = QFont(option.font)
-        label_font.setBold(True)
-        painter.setFont(label_font)
+        font_key = (option.font.family(), option.font.pointSize())
+        if font_key != self._font_key:
+            self._label_font = QFont(option.font)
+            self._label_font.setBold(True)
+            self._info_font = QFont(option.font)
+            self._info_font.setPointSize(max(7, int(option.font.pointSize() - 2)))
+            self._font_key = font_key
 
+        painter.setFont(self._label_font)
         fg = option.palette.highlightedText().color() if selected else option.palette.text().color()
         painter.setPen(fg)
-        painter.drawText(rect, int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop), label)
-
-        info_font = QFont(option.font)
-        info_font.setPointSize(max(7, int(info_font.pointSize() - 2)))
-        painter.setFont(info_font)
+        painter.drawText(rect, self._ALIGN_TL, label)
 
+        painter.setFont(self._info_font)
         info_fg = fg if selected else self._theme_info_fg
         painter.setPen(info_fg)
-        painter.drawText(rect, int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom), info)
+        painter.drawText(rect, self._ALIGN_BL, info)
 
         painter.restore()
 
     def sizeHint(self, option, index):
-        size = super().sizeHint(option, index)
-        return QSize(size.width(), max(size.height(), 52))
+        # Rows are uniform; compute once instead of per row per popup open.
+        if self._size_hint is None:
+            size = super().sizeHint(option, index)
+            self._size_hint = QSize(size.width(), max(size.height(), 52))
+        return self._size_hint
 
 
 class PitchModeDelegate(QStyledItemDelegate):
+    _ALIGN_TL = int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+    _ALIGN_BL = int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._theme_selected_bg = QColor("#6B999F")
         self._theme_info_fg = QColor(51, 206, 214, 170)
+        # Fonts derived from option.font, rebuilt only when the base font
+        # changes rather than twice per row per repaint.
+        self._font_key = None
+        self._label_font = None
+        self._info_font = None
+        self._size_hint = None
 
     def set_theme(self, theme: dict):
         try:
@@ -90,27 +192,32 @@ class PitchModeDelegate(QStyledItemDelegate):
 
         rect = option.rect.adjusted(10, 6, -10, -6)
 
-        label_font = QFont(option.font)
-        label_font.setBold(True)
-        painter.setFont(label_font)
+        font_key = (option.font.family(), option.font.pointSize())
+        if font_key != self._font_key:
+            self._label_font = QFont(option.font)
+            self._label_font.setBold(True)
+            self._info_font = QFont(option.font)
+            self._info_font.setPointSize(max(7, int(option.font.pointSize() - 2)))
+            self._font_key = font_key
 
+        painter.setFont(self._label_font)
         fg = option.palette.highlightedText().color() if selected else option.palette.text().color()
         painter.setPen(fg)
-        painter.drawText(rect, int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop), label)
-
-        info_font = QFont(option.font)
-        info_font.setPointSize(max(7, int(info_font.pointSize() - 2)))
-        painter.setFont(info_font)
+        painter.drawText(rect, self._ALIGN_TL, label)
 
+        painter.setFont(self._info_font)
         info_fg = fg if selected else self._theme_info_fg
         painter.setPen(info_fg)
-        painter.drawText(rect, int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom), info)
+        painter.drawText(rect, self._ALIGN_BL, info)
 
         painter.restore()
 
     def sizeHint(self, option, index):
-        size = super().sizeHint(option, index)
-        return QSize(size.width(), max(size.height(), 52))
+        # Rows are uniform; compute once instead of per row per popup open.
+        if self._size_hint is None:
+            size = super().sizeHint(option, index)
+            self._size_hint = QSize(size.width(), max(size.height(), 52))
+        return self._size_hint
 
 
 class SettingsPanel(QWidget):
@@ -133,6 +240,10 @@ class SettingsPanel(QWidget):
         self._theme = None
         self._sample_rate = 44100
 
+        # Batch/suppress state for settings_changed; see batch_settings().
+        self._emit_depth = 0
+        self._emit_pending = False
+
         root_layout = QVBoxLayout(self)
         root_layout.setContentsMargins(0, 0, 0, 0)
 
@@ -187,7 +298,7 @@ class SettingsPanel(QWidget):
 
         self.normalize_check = QCheckBox(tr("settings.checkbox.normalize", "Normalize to 0dB"))
         self.normalize_check.setChecked(False)
-        self.normalize_check.stateChanged.connect(lambda _s: self.settings_changed.emit())
+        self.normalize_check.stateChanged.connect(self._emit_settings_changed)
         process_layout.addWidget(self.normalize_check)
 
         self.preserve_formants_check = QCheckBox(tr("settings.checkbox.preserve_formants", "Preserve Formants"))
@@ -210,7 +321,7 @@ class SettingsPanel(QWidget):
         self.pitch_amount_slider.setRange(0, 100)
         self.pitch_amount_slider.setValue(100)
         self.pitch_amount_slider.valueChanged.connect(self._on_pitch_amount_slider)
-        self.pitch_amount_slider.sliderReleased.connect(lambda: self.settings_changed.emit())
+        self.pitch_amount_slider.sliderReleased.connect(self._emit_settings_changed)
         soft_layout.addWidget(self.pitch_amount_slider)
 
         retune_row = QHBoxLayout()
@@ -224,7 +335,7 @@ class SettingsPanel(QWidget):
         self.retune_speed_slider.setRange(0, 200)
         self.retune_speed_slider.setValue(40)
         self.retune_speed_slider.valueChanged.connect(self._on_retune_speed_slider)
-        self.retune_speed_slider.sliderReleased.connect(lambda: self.settings_changed.emit())
+        self.retune_speed_slider.sliderReleased.connect(self._emit_settings_changed)
         soft_layout.addWidget(self.retune_speed_slider)
 
         vib_row = QHBoxLayout()
@@ -238,7 +349,7 @@ class SettingsPanel(QWidget):
         self.preserve_vibrato_slider.setRange(0, 100)
         self.preserve_vibrato_slider.setValue(100)
         self.preserve_vibrato_slider.valueChanged.connect(self._on_preserve_vibrato_slider)
-        self.preserve_vibrato_slider.sliderReleased.connect(lambda: self.settings_changed.emit())
+        self.preserve_vibrato_slider.sliderReleased.connect(self._emit_settings_changed)
         soft_layout.addWidget(self.preserve_vibrato_slider)
 
         self.soft_widget.setVisible(False)
@@ -259,9 +370,17 @@ class SettingsPanel(QWidget):
         self.formant_slider.setRange(-500, 500)
         self.formant_slider.setValue(0)
         self.formant_slider.valueChanged.connect(self._on_formant_slider)
-        self.formant_slider.sliderReleased.connect(lambda: self.settings_changed.emit())
+        self.formant_slider.sliderReleased.connect(self._on_formant_released)
         formant_layout.addWidget(self.formant_slider)
 
+        # Coalesces keyboard/wheel formant edits (which never get a
+        # sliderReleased) into one settings_changed after the burst settles.
+        self._formant_debounce = QTimer(self)
+        self._formant_debounce.setSingleShot(True)
+        self._formant_debounce.setInterval(150)
+        self._formant_debounce.timeout.connect(self._emit_settings_changed)
+        self._last_formant = int(self.formant_slider.value())
+
         self.formant_widget.setVisible(False)
         process_layout.addWidget(self.formant_widget)
 
@@ -276,7 +395,7 @@ class SettingsPanel(QWidget):
         self.stretch_method_combo.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.stretch_method_combo.setItemDelegate(StretchMethodDelegate(self.stretch_method_combo))
         self._populate_stretch_methods()
-        self.stretch_method_combo.currentIndexChanged.connect(lambda _i: self.settings_changed.emit())
+        self.stretch_method_combo.currentIndexChanged.connect(self._emit_settings_changed)
         stretch_method_row.addWidget(self.stretch_method_combo, 1)
         process_layout.addLayout(stretch_method_row)
 
@@ -310,6 +429,34 @@ class SettingsPanel(QWidget):
         stretch_manual_row.addWidget(self.stretch_spin)
         process_layout.addLayout(stretch_manual_row)
 
+        # Inline over-2x confirmation. A modal dialog here would block the
+        # event loop mid-scrub; the banner keeps paints and signals flowing
+        # while the user decides.
+        self._pending_over2_factor = None
+        self.over2_banner = QWidget()
+        over2_layout = QVBoxLayout(self.over2_banner)
+        over2_layout.setContentsMargins(0, 4, 0, 0)
+        over2_layout.setSpacing(4)
+        self.over2_text_label = QLabel(
+            tr("settings.stretch.confirm.text", "Going over x2 can cause a lot of artifacts and could make your sample sound fake.")
+        )
+        self.over2_text_label.setWordWrap(True)
+        self.over2_text_label.setStyleSheet("color: rgba(51, 206, 214, 170); font-size: 10px;")
+        over2_layout.addWidget(self.over2_text_label)
+        self.over2_info_label = QLabel("")
+        self.over2_info_label.setStyleSheet("font-size: 10px;")
+        over2_layout.addWidget(self.over2_info_label)
+        over2_btn_row = QHBoxLayout()
+        self.over2_yes_btn = QPushButton(tr("settings.stretch.confirm.yes", "hell yeah!"))
+        self.over2_yes_btn.clicked.connect(self._on_over2_accepted)
+        over2_btn_row.addWidget(self.over2_yes_btn)
+        self.over2_no_btn = QPushButton(tr("settings.stretch.confirm.no", "hell no!!"))
+        self.over2_no_btn.clicked.connect(self._on_over2_declined)
+        over2_btn_row.addWidget(self.over2_no_btn)
+        over2_layout.addLayout(over2_btn_row)
+        self.over2_banner.setVisible(False)
+        process_layout.addWidget(self.over2_banner)
+
         layout.addWidget(self.process_group)
 
         self.clean_group = QGroupBox(tr("settings.group.cleanliness", "Cleanliness"))
@@ -326,7 +473,7 @@ class SettingsPanel(QWidget):
         self.cleanliness_slider.setRange(0, 100)
         self.cleanliness_slider.setValue(0)
         self.cleanliness_slider.valueChanged.connect(self._on_cleanliness_slider)
-        self.cleanliness_slider.sliderReleased.connect(lambda: self.settings_changed.emit())
+        self.cleanliness_slider.sliderReleased.connect(self._emit_settings_changed)
         clean_layout.addWidget(self.cleanliness_slider)
 
         self.clean_advanced_check = QCheckBox(tr("settings.checkbox.advanced_mode", "Advanced Mode"))
@@ -353,7 +500,7 @@ class SettingsPanel(QWidget):
         self.clean_lowcut_slider.setRange(0, 200)
         self.clean_lowcut_slider.setValue(50)
         self.clean_lowcut_slider.valueChanged.connect(self._on_clean_lowcut_slider)
-        self.clean_lowcut_slider.sliderReleased.connect(lambda: self.settings_changed.emit())
+        self.clean_lowcut_slider.sliderReleased.connect(self._emit_settings_changed)
         clean_adv_layout.addWidget(self.clean_lowcut_slider)
 
         hs_gain_row = QHBoxLayout()
@@ -367,7 +514,7 @@ class SettingsPanel(QWidget):
         self.clean_high_shelf_gain_slider.setRange(-24, 0)
         self.clean_high_shelf_gain_slider.setValue(0)
         self.clean_high_shelf_gain_slider.valueChanged.connect(self._on_clean_high_shelf_gain_slider)
-        self.clean_high_shelf_gain_slider.sliderReleased.connect(lambda: self.settings_changed.emit())
+        self.clean_high_shelf_gain_slider.sliderReleased.connect(self._emit_settings_changed)
         clean_adv_layout.addWidget(self.clean_high_shelf_gain_slider)
 
         hs_freq_row = QHBoxLayout()
@@ -378,7 +525,7 @@ class SettingsPanel(QWidget):
         self.clean_high_shelf_freq_spin.setSingleStep(250)
         self.clean_high_shelf_freq_spin.setValue(10000)
         self.clean_high_shelf_freq_spin.setSuffix(" Hz")
-        self.clean_high_shelf_freq_spin.valueChanged.connect(lambda _v: self.settings_changed.emit())
+        self.clean_high_shelf_freq_spin.valueChanged.connect(self._emit_settings_changed)
         hs_freq_row.addWidget(self.clean_high_shelf_freq_spin)
         clean_adv_layout.addLayout(hs_freq_row)
 
@@ -398,11 +545,11 @@ class SettingsPanel(QWidget):
         button_layout = QVBoxLayout()
 
         self.export_btn = QPushButton(tr("settings.button.export_wav", "Export WAV"))
-        self.export_btn.clicked.connect(lambda: self.export_clicked.emit())
+        self.export_btn.clicked.connect(self._emit_export)
         button_layout.addWidget(self.export_btn)
 
         self.quick_export_btn = QPushButton(tr("settings.button.quick_export", "Quick Export"))
-        self.quick_export_btn.clicked.connect(lambda: self.quick_export_clicked.emit())
+        self.quick_export_btn.clicked.connect(self._emit_quick_export)
         button_layout.addWidget(self.quick_export_btn)
 
         layout.addLayout(button_layout)
@@ -415,7 +562,7 @@ class SettingsPanel(QWidget):
         self.themes_description_label = QLabel(tr("settings.themes.description", "Customize the app colors."))
         themes_layout.addWidget(self.themes_description_label)
         self.open_theme_editor_btn = QPushButton(tr("settings.themes.open_editor", "Open Theme Editor"))
-        self.open_theme_editor_btn.clicked.connect(lambda: self.themes_requested.emit())
+        self.open_theme_editor_btn.clicked.connect(self._emit_themes_requested)
         themes_layout.addWidget(self.open_theme_editor_btn)
         themes_layout.addStretch()
 
@@ -424,19 +571,67 @@ class SettingsPanel(QWidget):
         self.tabs.currentChanged.connect(self._on_tab_changed)
         root_layout.addWidget(self.tabs)
 
+        # Holding the octave spinbox arrow fires valueChanged per repeat; the
+        # label updates live but the reprocess-triggering emit is debounced.
+        self._target_debounce = QTimer(self)
+        self._target_debounce.setSingleShot(True)
+        self._target_debounce.setInterval(150)
+        self._target_debounce.timeout.connect(self._emit_settings_changed)
+
         self.note_combo.currentTextChanged.connect(self._update_target_label)
         self.octave_spin.valueChanged.connect(self._update_target_label)
         self._update_target_label()
 
-        self._on_pitch_mode_changed(0)
-        self._on_clean_lowcut_slider(int(self.clean_lowcut_slider.value()))
-        self._on_clean_high_shelf_gain_slider(int(self.clean_high_shelf_gain_slider.value()))
-        self._apply_cleanliness_mode_ui()
+        with self.batch_settings():
+            self._on_pitch_mode_changed(0)
+            self._on_clean_lowcut_slider(int(self.clean_lowcut_slider.value()))
+            self._on_clean_high_shelf_gain_slider(int(self.clean_high_shelf_gain_slider.value()))
+            self._apply_cleanliness_mode_ui()
         try:
             self.retranslate_ui()
         except Exception:
             pass
 
+    @contextmanager
+    def batch_settings(self):
+        """Coalesce settings_changed emissions inside the block into one.
+
+        Reentrant: nested blocks emit once at the outermost exit, and only
+        if something inside actually tried to emit.
+        """
+        self._emit_depth += 1
+        try:
+            yield
+        finally:
+            self._emit_depth -= 1
+            if self._emit_depth == 0 and self._emit_pending:
+                self._emit_pending = False
+                self.settings_changed.emit()
+
+    def _emit_settings(self):
+        if self._emit_depth:
+            self._emit_pending = True
+        else:
+            self.settings_changed.emit()
+
+    # Decorated zero-arg slots take PyQt's C++ invocation path instead of a
+    # per-emission Python-callable adapter, which matters under slider drags.
+    @pyqtSlot()
+    def _emit_settings_changed(self):
+        self._emit_settings()
+
+    @pyqtSlot()
+    def _emit_export(self):
+        self.export_clicked.emit()
+
+    @pyqtSlot()
+    def _emit_quick_export(self):
+        self.quick_export_clicked.emit()
+
+    @pyqtSlot()
+    def _emit_themes_requested(self):
+        self.themes_requested.emit()
+
     def _on_tab_changed(self, index: int):
         try:
             if int(index) == 1:
@@ -464,6 +659,11 @@ class SettingsPanel(QWidget):
             self.stretching_method_label.setText(tr("settings.label.stretching_method", "Stretching Method:"))
             self.stretch_factor_label.setText(tr("settings.label.stretch_factor", "Stretch Factor:"))
             self.stretch_manual_label.setText(tr("settings.label.manual", "Manual:"))
+            self.over2_text_label.setText(
+                tr("settings.stretch.confirm.text", "Going over x2 can cause a lot of artifacts and could make your sample sound fake.")
+            )
+            self.over2_yes_btn.setText(tr("settings.stretch.confirm.yes", "hell yeah!"))
+            self.over2_no_btn.setText(tr("settings.stretch.confirm.no", "hell no!!"))
         except Exception:
             pass
 
@@ -803,13 +1003,16 @@ class SettingsPanel(QWidget):
             self._apply_cleanliness_automation(int(self.cleanliness_slider.value()))
         except Exception:
             pass
-        self.settings_changed.emit()
+        # The target-label debounce may have been armed while signals were
+        # blocked; this emit already covers it.
+        self._target_debounce.stop()
+        self._emit_settings()
 
     def _on_pitch_mode_changed(self, _index: int):
         mode = str(self.pitch_mode_combo.currentData())
         is_soft = mode in ("world_soft", "praat_soft")
         self.soft_widget.setVisible(bool(is_soft))
-        self.settings_changed.emit()
+        self._emit_settings()
 
     def _on_pitch_amount_slider(self, value: int):
         self.pitch_amount_value_label.setText(f"{int(value)}%")
@@ -825,10 +1028,9 @@ class SettingsPanel(QWidget):
         note = self.note_combo.currentText()
         octave = self.octave_spin.value()
 
-        note_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-        semitone = note_names.index(note)
+        semitone = _NOTE_IDX[note]
         midi = 12 * (octave + 1) + semitone
-        freq = 440.0 * (2 ** ((midi - 69) / 12))
+        freq = _MIDI_HZ[midi]
 
         self.target_label.setText(
             tr("settings.target_fmt", "Target: {note}{octave} ({freq:.2f} Hz)").format(
@@ -841,16 +1043,27 @@ class SettingsPanel(QWidget):
             self._apply_cleanliness_automation(int(self.cleanliness_slider.value()))
         except Exception:
             pass
-        self.settings_changed.emit()
+        self._target_debounce.start()
 
     def _on_formant_toggle(self, state):
         """Show/hide formant slider based on checkbox."""
         self.formant_widget.setVisible(state == 0)
-        self.settings_changed.emit()
+        self._emit_settings()
 
     def _on_formant_slider(self, value):
         """Update formant slider label."""
-        self.formant_value_label.setText(f"{value} ct")
+        v = int(value)
+        if v == self._last_formant:
+            return
+        self._last_formant = v
+        self.formant_value_label.setText(f"{v} ct")
+        self._formant_debounce.start()
+
+    def _on_formant_released(self):
+        # End of a drag gesture: flush immediately instead of waiting out
+        # the idle window.
+        self._formant_debounce.stop()
+        self._emit_settings()
 
     def _on_cleanliness_slider(self, value):
         """Update cleanliness slider label."""
@@ -879,7 +1092,7 @@ class SettingsPanel(QWidget):
             self._apply_cleanliness_automation(int(self.cleanliness_slider.value()))
         except Exception:
             pass
-        self.settings_changed.emit()
+        self._emit_settings()
 
     def _apply_cleanliness_mode_ui(self):
         advanced = bool(self.clean_advanced_check.isChecked())
@@ -893,13 +1106,9 @@ class SettingsPanel(QWidget):
         note = str(self.note_combo.currentText())
         octave = int(self.octave_spin.value())
 
-        note_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-        try:
-            semitone = int(note_names.index(note))
-        except Exception:
-            semitone = 0
+        semitone = int(_NOTE_IDX.get(note, 0))
         midi = 12 * (octave + 1) + semitone
-        return float(440.0 * (2 ** ((midi - 69) / 12)))
+        return float(_MIDI_HZ[midi])
 
     def _get_nyquist_hz(self) -> float:
         try:
@@ -974,37 +1183,8 @@ class SettingsPanel(QWidget):
         librosa_available = _module_available("librosa")
 
         items = [
-            (
-                tr("settings.stretch_method.audiotsm_wsola.label", "WSOLA Speech"),
-                tr(
-                    "settings.stretch_method.audiotsm_wsola.info",
-                    "Crisp in quality and the best for general speech audio. Can sound robotic if over-done.",
-                ),
-                "audiotsm_wsola",
-            ),
-            (
-                tr("settings.stretch_method.audiotsm_phasevocoder.label", "Phasevocoder"),
-                tr("settings.stretch_method.audiotsm_phasevocoder.info", "Smoother and more ideal under x2 stretching"),
-                "audiotsm_phasevocoder",
-            ),
-            (
-                tr("settings.stretch_method.rubberband_default_engine_finer.label", "Rubberband Default"),
-                tr("settings.stretch_method.rubberband_default_engine_finer.info", "Baseline of any stretching method."),
-                "rubberband_default_engine_finer",
-            ),
-            (
-                tr("settings.stretch_method.rubberband_percussive_engine_finer.label", "Rubberband Percussive"),
-                tr(
-                    "settings.stretch_method.rubberband_percussive_engine_finer.info",
-                    "Deals with transients and artifact removal a lot better than Rubberband Default.",
-                ),
-                "rubberband_percussive_engine_finer",
-            ),
-            (
-                tr("settings.stretch_method.tdpsola.label", "TD-PSOLA"),
-                tr("settings.stretch_method.tdpsola.info", "Fallback stretcher that works without audiotsm/rubberband (can be slower)."),
-                "tdpsola",
-            ),
+            (tr(label_key, label_default), tr(info_key, info_default), key)
+            for label_key, label_default, info_key, info_default, key in _STRETCH_METHOD_DEFS
         ]
 
         model = QStandardItemModel(self.stretch_method_combo)
@@ -1025,12 +1205,17 @@ class SettingsPanel(QWidget):
 
         self.stretch_method_combo.setModel(model)
 
-        fm = QFontMetrics(self.stretch_method_combo.font())
-        max_w = 0
-        for label, info, _key in items:
-            max_w = max(max_w, fm.horizontalAdvance(label), fm.horizontalAdvance(info))
+        font = self.stretch_method_combo.font()
+        max_w = _max_text_advance(
+            font.family(), font.pointSize(), tuple(t for label, info, _key in items for t in (label, info))
+        )
         view = self.stretch_method_combo.view()
         view.setTextElideMode(Qt.TextElideMode.ElideNone)
+        if isinstance(view, QListView):
+            # All rows share one sizeHint, so let the view assume uniform
+            # sizes and lay out / repaint lazily instead of per-row.
+            view.setUniformItemSizes(True)
+            view.setLayoutMode(QListView.LayoutMode.Batched)
         desired = max_w + 60
         view.setMinimumWidth(max(320, min(520, desired)))
 
@@ -1058,29 +1243,12 @@ class SettingsPanel(QWidget):
 
         items = [
             (
-                tr("settings.pitch_mode.praat_soft.label", "PSOLA (Praat) Soft"),
-                tr(
-                    "settings.pitch_mode.praat_soft.info",
-                    "Natural + smooth retune using Praat overlap-add. Requires praat-parselmouth.",
-                ),
-                "praat_soft",
-                bool(praat_available),
-            ),
-            (
-                tr("settings.pitch_mode.world_soft.label", "WORLD Soft (Retune)"),
-                tr("settings.pitch_mode.world_soft.info", "Smooth retune with amount/speed/vibrato controls (WORLD vocoder)."),
-                "world_soft",
-                True,
-            ),
-            (
-                tr("settings.pitch_mode.world_hard.label", "WORLD Hard (Flatten)"),
-                tr(
-                    "settings.pitch_mode.world_hard.info",
-                    "Hard snap to the target note for the most robotic/locked sound (WORLD vocoder).",
-                ),
-                "world_hard",
-                True,
-            ),
+                tr(label_key, label_default),
+                tr(info_key, info_default),
+                key,
+                bool(praat_available) if key == "praat_soft" else True,
+            )
+            for label_key, label_default, info_key, info_default, key in _PITCH_MODE_DEFS
         ]
 
         model = QStandardItemModel(self.pitch_mode_combo)
@@ -1110,29 +1278,50 @@ class SettingsPanel(QWidget):
             except Exception:
                 pass
 
-        fm = QFontMetrics(self.pitch_mode_combo.font())
-        max_w = 0
-        for label, info, _key, _enabled in items:
-            max_w = max(max_w, fm.horizontalAdvance(label), fm.horizontalAdvance(info))
+        font = self.pitch_mode_combo.font()
+        max_w = _max_text_advance(
+            font.family(), font.pointSize(), tuple(t for label, info, _key, _enabled in items for t in (label, info))
+        )
         view = self.pitch_mode_combo.view()
         view.setTextElideMode(Qt.TextElideMode.ElideNone)
+        if isinstance(view, QListView):
+            # All rows share one sizeHint, so let the view assume uniform
+            # sizes and lay out / repaint lazily instead of per-row.
+            view.setUniformItemSizes(True)
+            view.setLayoutMode(QListView.LayoutMode.Batched)
         desired = max_w + 60
         view.setMinimumWidth(max(320, min(520, desired)))
 
-    def _confirm_over_2x(self, requested: float) -> bool:
-        msg = QMessageBox(self)
-        msg.setWindowTitle(tr("settings.stretch.confirm.title", "Warning"))
-        msg.setText(tr("settings.stretch.confirm.text", "Going over x2 can cause a lot of artifacts and could make your sample sound fake."))
-        msg.setInformativeText(tr("settings.stretch.confirm.info_fmt", "Requested: {factor:.2f}x").format(factor=float(requested)))
-        yes_btn = msg.addButton(tr("settings.stretch.confirm.yes", "hell yeah!"), QMessageBox.ButtonRole.AcceptRole)
-        no_btn = msg.addButton(tr("settings.stretch.confirm.no", "hell no!!"), QMessageBox.ButtonRole.RejectRole)
-        msg.setDefaultButton(no_btn)
-        msg.exec()
-        return msg.clickedButton() == yes_btn
+    def _show_over2_banner(self, requested: float):
+        self._pending_over2_factor = float(requested)
+        self.over2_info_label.setText(
+            tr("settings.stretch.confirm.info_fmt", "Requested: {factor:.2f}x").format(factor=float(requested))
+        )
+        if not self.over2_banner.isVisible():
+            self.over2_banner.setVisible(True)
+
+    def _hide_over2_banner(self):
+        self._pending_over2_factor = None
+        if self.over2_banner.isVisible():
+            self.over2_banner.setVisible(False)
+
+    def _on_over2_accepted(self):
+        requested = self._pending_over2_factor
+        self._hide_over2_banner()
+        if requested is None:
+            return
+        self._stretch_over2_confirmed = True
+        self._apply_stretch_effective(float(requested), emit=True)
+
+    def _on_over2_declined(self):
+        self._hide_over2_banner()
+        self._apply_stretch_effective(2.0, emit=True)
 
     def _apply_stretch_effective(self, factor: float, emit: bool):
         f = float(factor)
         self._stretch_factor_effective = f
+        # Committing a factor settles any outstanding over-2x question.
+        self._hide_over2_banner()
         if f <= 2.0:
             self._stretch_over2_confirmed = False
 
@@ -1152,58 +1341,57 @@ class SettingsPanel(QWidget):
             self.stretch_slider.blockSignals(False)
 
         if emit:
-            self.settings_changed.emit()
+            self._emit_settings()
 
-    def _apply_stretch_pending_ui(self, factor: float):
+    def _apply_stretch_pending_ui(self, factor: float, source: str = "code"):
+        # During a drag only the label and the widget the user is NOT holding
+        # need updating; echoing the value back into the source widget costs
+        # a setValue plus a blockSignals pair per tick for nothing.
         f = float(factor)
         self._stretch_factor_pending = f
-        self.stretch_value_label.setText(f"{f:.2f}x")
 
-        self.stretch_spin.blockSignals(True)
-        self.stretch_spin.setValue(f)
-        self.stretch_spin.blockSignals(False)
+        text = f"{f:.2f}x"
+        if text != self.stretch_value_label.text():
+            self.stretch_value_label.setText(text)
 
-        if f <= 5.0:
-            self.stretch_slider.blockSignals(True)
-            self.stretch_slider.setValue(int(round(f * 100.0)))
-            self.stretch_slider.blockSignals(False)
-        else:
-            self.stretch_slider.blockSignals(True)
-            self.stretch_slider.setValue(500)
-            self.stretch_slider.blockSignals(False)
+        if source != "spin" and float(self.stretch_spin.value()) != f:
+            self.stretch_spin.blockSignals(True)
+            self.stretch_spin.setValue(f)
+            self.stretch_spin.blockSignals(False)
+
+        if source != "slider":
+            slider_v = int(round(f * 100.0)) if f <= 5.0 else 500
+            if int(self.stretch_slider.value()) != slider_v:
+                self.stretch_slider.blockSignals(True)
+                self.stretch_slider.setValue(slider_v)
+                self.stretch_slider.blockSignals(False)
 
     def _on_stretch_slider_value_changed(self, value: int):
         factor = float(value) / 100.0
-        self._apply_stretch_pending_ui(factor)
+        self._apply_stretch_pending_ui(factor, source="slider")
 
     def _on_stretch_slider_released(self):
         requested = float(self._stretch_factor_pending)
 
         if requested <= 2.0 or self._stretch_over2_confirmed:
+            self._hide_over2_banner()
             self._apply_stretch_effective(requested, emit=True)
             return
 
-        if self._confirm_over_2x(requested):
-            self._stretch_over2_confirmed = True
-            self._apply_stretch_effective(requested, emit=True)
-        else:
-            self._apply_stretch_effective(2.0, emit=True)
+        self._show_over2_banner(requested)
 
     def _on_stretch_spin_value_changed(self, value: float):
         v = float(value)
-        self._apply_stretch_pending_ui(v)
+        self._apply_stretch_pending_ui(v, source="spin")
 
     def _on_stretch_spin_editing_finished(self):
         requested = float(self.stretch_spin.value())
         if requested <= 2.0 or self._stretch_over2_confirmed:
+            self._hide_over2_banner()
             self._apply_stretch_effective(requested, emit=True)
             return
 
-        if self._confirm_over_2x(requested):
-            self._stretch_over2_confirmed = True
-            self._apply_stretch_effective(requested, emit=True)
-        else:
-            self._apply_stretch_effective(2.0, emit=True)
+        self._show_over2_banner(requested)
 
     def get_target_note(self) -> str:
         """Get the full target note name, e.g. 'C4'."""
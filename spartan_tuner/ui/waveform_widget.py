@@ -1,7 +1,7 @@
 import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtProperty, pyqtSignal
 from PyQt6.QtGui import QColor
 
 from utils.i18n import tr
@@ -98,6 +98,12 @@ class WaveformWidget(QWidget):
         self._performance_mode = False
         self._max_points = 100000
 
+        # 0..255 alpha applied to the blob pen/fill; animated by the main
+        # window's view cross-fade. Cheaper than a QGraphicsOpacityEffect,
+        # which would raster the whole plot offscreen every frame.
+        self._waveform_alpha = 255
+        self._fill_base_alpha = 110
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
@@ -149,20 +155,42 @@ class WaveformWidget(QWidget):
         except Exception:
             pass
 
+        self._apply_blob_colors()
+
+    def _apply_blob_colors(self):
+        """Re-apply the accent color at the current fade alpha."""
+        accent = str(self._theme.get("accent", "#33CED6"))
+        alpha = int(self._waveform_alpha)
+
+        c = QColor(accent)
+        if not c.isValid():
+            return
+
         try:
-            pen = pg.mkPen(color=accent, width=1)
+            pen = pg.mkPen(color=(c.red(), c.green(), c.blue(), alpha), width=1)
             self._blob_top_curve.setPen(pen)
             self._blob_bottom_curve.setPen(pen)
         except Exception:
             pass
 
         try:
-            c = QColor(accent)
-            if c.isValid():
-                self._blob_fill.setBrush(pg.mkBrush(c.red(), c.green(), c.blue(), 110))
+            fill_alpha = (int(self._fill_base_alpha) * alpha) // 255
+            self._blob_fill.setBrush(pg.mkBrush(c.red(), c.green(), c.blue(), fill_alpha))
         except Exception:
             pass
 
+    def _get_waveform_alpha(self) -> int:
+        return int(self._waveform_alpha)
+
+    def _set_waveform_alpha(self, alpha: int):
+        a = max(0, min(255, int(alpha)))
+        if a == self._waveform_alpha:
+            return
+        self._waveform_alpha = a
+        self._apply_blob_colors()
+
+    waveform_alpha = pyqtProperty(int, fget=_get_waveform_alpha, fset=_set_waveform_alpha)
+
     def set_performance_mode(self, enabled: bool):
         self._performance_mode = bool(enabled)
         self._max_points = 30000 if self._performance_mode else 100000
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 import numpy as np
 
@@ -54,6 +55,7 @@ def midi_to_note_name(midi: int) -> str:
 _NOTE_RE = re.compile(r"^\s*([A-Ga-g])\s*([#bB]?)\s*(-?\d+)\s*$")
 
 
+@lru_cache(maxsize=256)
 def note_name_to_midi(name: str) -> int:
     if not isinstance(name, str):
         raise ValueError("name must be a string")